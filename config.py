@@ -8,9 +8,14 @@ class Config:
     LOG_DIRECTORY = os.environ.get("LOG_DIRECTORY", "logs")
     LOG_FILE_FORMAT = "{time:YYYY-MM-DD HH:mm:ss.SSS} | {level: <8} | {name} | {message}"
     CONSOLE_LOG_FORMAT = "<green>{time:YYYY-MM-DD HH:mm:ss}</green> | <level>{level: <8}</level> | <cyan>{name}</cyan> | <level>{message}</level>"
-    LOG_ROTATION = "10 MB"
+    LOG_ROTATION = 10 * 1000 * 1000  # ログファイルをローテーションするサイズ (バイト数)
     LOG_RETENTION = 5
     LOG_COMPRESSION = "zip"
+    LOG_QUEUE_MAXSIZE = int(os.environ.get("LOG_QUEUE_MAXSIZE", 10000))  # ファイル出力キューの上限 (0 で上限なし)
+    LOG_DRAIN_BATCH_SIZE = 100  # ファイルへ 1 回で書き出す最大レコード数
+    LOG_FILE_BUFFER_SIZE = int(os.environ.get("LOG_FILE_BUFFER_SIZE", 65536))  # ログファイルの書き込みバッファ (バイト数、1 以下でバッファなし)
+    LOG_FLUSH_INTERVAL = float(os.environ.get("LOG_FLUSH_INTERVAL", 1.0))  # ログファイルのバッファをフラッシュする間隔 (秒)
+    DIAGNOSE_LOG_LEVEL = os.environ.get("DIAGNOSE_LOG_LEVEL", "ERROR")  # 変数値付きのトレースバックを diagnose.log に出力する最低レベル
 
     EXCLUDE_WORDS = ["英語版", "Emc", "(英語版)"]
 
@@ -99,4 +104,18 @@ class Config:
         'toccolours',
     ]
 
-    BASE_URL = "https://ja.wikipedia.org/w/api.php"
\ No newline at end of file
+    BASE_URL = "https://ja.wikipedia.org/w/api.php"
+
+    # HTTP キャッシュと接続プールの設定
+    CACHE_NAME = "wiki_cache"
+    CACHE_BACKEND = os.environ.get("CACHE_BACKEND", "sqlite")
+    CACHE_EXPIRE_DAYS = 7
+    HTTP_POOL_CONNECTIONS = 16
+    HTTP_POOL_MAXSIZE = 64
+    HTTP_MAX_RETRIES = 3
+    HTTP_BACKOFF_FACTOR = 0.3
+    HTTP_RETRY_STATUS_CODES = [429, 502, 503, 504]
+    FETCH_MAX_WORKERS = 8
+    HTTP_TIMEOUT = 10  # 秒
+    PLAINTEXT_MIN_LENGTH_RATIO = 0.1  # プレーンテキストがページ (ウィキテキスト) のバイト数のこの割合未満であれば、切り詰められたものとして扱う
+    USER_AGENT = os.environ.get("USER_AGENT", "wiki-person-analyzer/0.1 (https://github.com/naoya-py/wiki-person-analyzer)")
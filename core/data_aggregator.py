@@ -1,7 +1,8 @@
-import json
 import os
+from pathlib import Path
 from typing import List
 from utils.logger import get_logger
+from utils.utils import dump_json_bytes
 
 logger = get_logger(__name__)
 
@@ -22,21 +23,22 @@ class DataAggregator:
         # Scraperクラスを動的にインポート
         from core.scraper import Scraper
 
-        for page_title in page_titles:
-            scraper = Scraper(page_title=page_title)
-            try:
-                scraper.fetch_page_data()
+        # ページデータの取得はスレッドで並行して行い、HTML の解析と抽出はページごとに順に行う
+        for page_title, fetch_result in Scraper.fetch_many(page_titles).items():
+            if fetch_result.is_err():
+                logger.error(f"{page_title}のデータ収集中にエラーが発生しました: {fetch_result.err_value}")
+                continue
 
-                infobox_data = scraper.extract_infobox_data()
-                text_data = scraper.extract_text()
-                image_data = scraper.extract_image_data()
+            scraper = fetch_result.ok_value
+            try:
+                extracted_data = scraper.parse_all()
                 categories = scraper.extract_categories()
                 additional_table_data = scraper.extract_additional_table_data()
 
                 person_data = {
-                    "infobox_data": infobox_data,
-                    "text_data": text_data,
-                    "image_data": image_data,
+                    "infobox_data": extracted_data["infobox"],
+                    "text_data": extracted_data["text"],
+                    "image_data": extracted_data["images"],
                     "categories": categories,
                     "additional_table_data": additional_table_data,
                 }
@@ -50,6 +52,5 @@ class DataAggregator:
         os.makedirs(directory, exist_ok=True)
         output_path = os.path.join(directory, output_filename)
 
-        with open(output_path, "w", encoding="utf-8") as f:
-            json.dump(combined_data, f, ensure_ascii=False, indent=2)
+        Path(output_path).write_bytes(dump_json_bytes(combined_data))
         logger.info(f"全データを{output_path}に保存しました")
\ No newline at end of file
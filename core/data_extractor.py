@@ -6,6 +6,14 @@ from typing import Dict, Optional, List
 
 logger = get_logger(__name__)
 
+# 文の区切り (句点、終端文字の直後)
+_SENTENCE_END_RE = re.compile(r'(?<=[。？！])\s*')
+# 「父 名前」または「名前 を父」/「母 名前」または「名前 を母」
+_FATHER_RE = re.compile(r'(父\s*(?P<father1>[^\s、。]+))|(?P<father2>[\w・ー]+)\s*を父')
+_MOTHER_RE = re.compile(r'(母\s*(?P<mother1>[^\s、。]+))|(?P<mother2>[\w・ー]+)\s*を母')
+# 母の名前の後に続く「も...」
+_MOTHER_TRAILING_RE = re.compile(r'も.*$')
+
 
 class DataExtractor:
     """
@@ -23,48 +31,50 @@ class DataExtractor:
         Returns:
             List[str]: 分割された文のリスト。
         """
-        sentence_endings = re.compile(r'(?<=[。？！])\s*')
-        sentences = sentence_endings.split(text)
-        logger.debug(f"Split text into sentences: {sentences}")
+        sentences = _SENTENCE_END_RE.split(text)
+        logger.debug("Split text into sentences: {}", sentences)
         return sentences
 
     @staticmethod
-    def extract_parents_info(text: str) -> Dict[str, Optional[str]]:
+    def extract_parents_info(text: Optional[str]) -> Dict[str, Optional[str]]:
         """
         テキストから父と母の情報を抽出する。
 
         Args:
-            text (str): 対象のテキスト。
+            text (Optional[str]): 対象のテキスト。
 
         Returns:
             Dict[str, Optional[str]]: 抽出された父と母の情報。
         """
-        logger.debug(f"Extracting parents info from text: {text}")
+        logger.debug("Extracting parents info from text: {}", text)
+
+        if not text or text.isspace():
+            return {
+                '父': None,
+                '母': None
+            }
 
         # 文単位に分割
         sentences = DataExtractor.split_into_sentences(text)
 
-        father_pattern = re.compile(r'(父\s*(?P<father1>[^\s、。]+))|(?P<father2>[\w・ー]+)\s*を父')
-        mother_pattern = re.compile(r'(母\s*(?P<mother1>[^\s、。]+))|(?P<mother2>[\w・ー]+)\s*を母')
-
         father_name = None
         mother_name = None
 
         for sentence in sentences:
-            logger.debug(f"Processing sentence: {sentence}")
+            logger.debug("Processing sentence: {}", sentence)
             if not father_name:
-                father_match = father_pattern.search(sentence)
+                father_match = _FATHER_RE.search(sentence)
                 if father_match:
                     father_name = father_match.group('father1') if father_match.group(
                         'father1') else father_match.group('father2')
 
             if not mother_name:
-                mother_match = mother_pattern.search(sentence)
+                mother_match = _MOTHER_RE.search(sentence)
                 if mother_match:
                     mother_name = mother_match.group('mother1') if mother_match.group(
                         'mother1') else mother_match.group('mother2')
                     # Remove any trailing text after the mother's name
-                    mother_name = re.sub(r'も.*$', '', mother_name)
+                    mother_name = _MOTHER_TRAILING_RE.sub('', mother_name)
 
             if father_name and mother_name:
                 break
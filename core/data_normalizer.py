@@ -1,10 +1,70 @@
 import re
-import dateparser
+import calendar
+import functools
 from typing import Optional, List, Dict, Any
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# "YYYY年[MM月[DD日]]" 形式の日付文字列
+_JP_DATE_RE = re.compile(r"(\d{4})年(?:\s*(\d{1,2})月(?:\s*(\d{1,2})日)?)?")
+# "YYYY-MM-DD" / "YYYY/MM/DD" 形式の日付文字列
+_NUMERIC_DATE_RE = re.compile(r"(\d{4})[-/](\d{1,2})[-/](\d{1,2})")
+# 元号と元年の西暦
+_ERA_START_YEARS = {
+    "令和": 2019,
+    "平成": 1989,
+    "昭和": 1926,
+    "大正": 1912,
+    "明治": 1868
+}
+# "元号N年[M月[D日]]" 形式の和暦 (元号はまとめて 1 つのパターンで照合する)
+_ERA_DATE_RE = re.compile(r"(" + "|".join(_ERA_START_YEARS) + r")(\d+|元)年(\d+)?月?(\d+)?日?")
+
+# 生誕情報から抽出する国名のリスト（必要に応じて追加）
+_KNOWN_COUNTRIES = [
+    "アメリカ合衆国", "ドイツ帝国", "ポーランド立憲王国", "フランス共和国", "日本", "イギリス", "カナダ",
+    "中国", "ロシア", "インド", "ブラジル", "オーストラリア", "イタリア", "スペイン", "韓国"
+]
+_COUNTRY_RE = re.compile(r"(" + "|".join(_KNOWN_COUNTRIES) + r")")
+_LEADING_SEPARATOR_RE = re.compile(r"^[・、]")
+# アメリカ合衆国の場合は "州 都市"、それ以外は "[王国] 都市"
+_US_STATE_CITY_RE = re.compile(r"([^\d\s]+州)\s*([^\d\s]+)$")
+_KINGDOM_CITY_RE = re.compile(r"([^\d\s]+王国)?\s*([^\d\s]+)$")
+# 国籍情報 ("国名 YYYY-YYYY" または期間なしの国名)
+_NATIONALITY_WITH_PERIOD_RE = re.compile(r"((?:[^\d\s]+(?:\s[^\d\s]+)*)+?)\s(\d{4})-(\d{2,4})")
+_NATIONALITY_WITHOUT_PERIOD_RE = re.compile(r"([^\d\s]+(?:\s[^\d\s]+)*)")
+# 子供情報
+_CHILD_ENTRY_SPLIT_RE = re.compile(r"\s+(?=\D)")
+_CHILD_NAME_RE = re.compile(r"^[^\d\s]+")
+_YEAR_RE = re.compile(r"\d{4}")
+# 分野情報の区切り ("・" や空白)
+_FIELD_SPLIT_RE = re.compile(r"[・\s]+")
+# 主な業績情報 ("賞 YYYY年")
+_ACHIEVEMENT_RE = re.compile(r"(\D+?)\s+(\d{4})年?")
+
+
+@functools.lru_cache(maxsize=4096)
+def _normalize_date(date_str: str) -> str:
+    """
+    日付文字列を標準形式 (YYYY-MM-DD) に変換する。同じ文字列の再解析を避けるためキャッシュする。
+    """
+    # 和暦から西暦への変換
+    date_str = DataNormalizer.convert_japanese_era_to_gregorian(date_str.strip())
+
+    match = _JP_DATE_RE.fullmatch(date_str) or _NUMERIC_DATE_RE.fullmatch(date_str)
+    if not match:
+        return "不明"
+
+    year, month, day = match.groups()
+    year = int(year)
+    month = int(month or 1)
+    day = int(day or 1)
+    # 存在しない日付 (2月30日など) は変換できないものとして扱う
+    if not (1 <= year and 1 <= month <= 12 and 1 <= day <= calendar.monthrange(year, month)[1]):
+        return "不明"
+    return f"{year:04d}-{month:02d}-{day:02d}"
+
 
 class DataNormalizer:
     """
@@ -12,44 +72,30 @@ class DataNormalizer:
     """
 
     @staticmethod
-    def normalize_date(date_str: str) -> Optional[str]:
+    def normalize_date(date_str: str) -> str:
         """
-        日付を標準形式 (YYYY-MM-DD) に変換する。
+        日付を標準形式 (YYYY-MM-DD) に変換する。変換できない場合は "不明" を返す。
         """
         if not date_str or date_str == "不明":
-            return None
+            return "不明"
 
-        # 和暦から西暦への変換
-        date_str = DataNormalizer.convert_japanese_era_to_gregorian(date_str)
-
-        # 日付形式の正規化
-        parsed_date = dateparser.parse(date_str, settings={'DATE_ORDER': 'YMD'})
-        if parsed_date:
-            return parsed_date.strftime("%Y-%m-%d")
-
-        return None
+        return _normalize_date(date_str)
 
     @staticmethod
     def convert_japanese_era_to_gregorian(date_str: str) -> str:
         """
         和暦を西暦に変換する。
         """
-        eras = {
-            "令和": 2019,
-            "平成": 1989,
-            "昭和": 1926,
-            "大正": 1912,
-            "明治": 1868
-        }
-        for era, start_year in eras.items():
-            match = re.match(rf"{era}(\d+)年(\d+)?月?(\d+)?日?", date_str)
-            if match:
-                year, month, day = match.groups()
-                year = start_year + int(year) - 1
-                month = month if month else "01"
-                day = day if day else "01"
-                return f"{year}年{month}月{day}日"
-        return date_str
+        match = _ERA_DATE_RE.match(date_str)
+        if not match:
+            return date_str
+
+        era, year, month, day = match.groups()
+        # 「元年」は 1 年として扱う
+        year = _ERA_START_YEARS[era] + (1 if year == "元" else int(year)) - 1
+        month = month if month else "01"
+        day = day if day else "01"
+        return f"{year}年{month}月{day}日"
 
     @staticmethod
     def standardize_location(location_str: str) -> str:
@@ -84,40 +130,35 @@ class DataNormalizer:
         return value if value else None
 
     @staticmethod
-    def extract_country_from_birth_info(birth_info: str) -> Dict[str, Optional[str]]:
+    def extract_country_from_birth_info(birth_info: Optional[str]) -> Dict[str, Optional[str]]:
         """
         生誕情報から国名、州/王国、都市名を抽出するメソッド。
         """
-        logger.debug(f"生誕情報: {birth_info}")
+        logger.debug("生誕情報: {}", birth_info)
 
-        # 国名のリスト（必要に応じて追加）
-        known_countries = [
-            "アメリカ合衆国", "ドイツ帝国", "ポーランド立憲王国", "フランス共和国", "日本", "イギリス", "カナダ",
-            "中国", "ロシア", "インド", "ブラジル", "オーストラリア", "イタリア", "スペイン", "韓国"
-        ]
-
-        # 国名を抽出する正規表現パターン
-        country_pattern = re.compile(r"(" + "|".join(known_countries) + r")")
-
-        country_match = country_pattern.search(birth_info)
         result: Dict[str, Optional[str]] = {
             "出身地_国": None,
             "出身地_州/王国": None,
             "出身地_都市": None
         }
 
+        # 生誕情報がない場合は正規表現を適用せずに返す
+        if not birth_info or birth_info.isspace():
+            return result
+
+        country_match = _COUNTRY_RE.search(birth_info)
         if country_match:
             country = country_match.group(0)
             remaining_info = birth_info[country_match.end():].strip()
 
             # 不要な記号を削除
-            remaining_info = re.sub(r"^[・、]", "", remaining_info)
+            remaining_info = _LEADING_SEPARATOR_RE.sub("", remaining_info)
 
             # 州/王国と都市を抽出するための正規表現パターン
             if "アメリカ合衆国" in country:
-                state_city_pattern = re.compile(r"([^\d\s]+州)\s*([^\d\s]+)$")
+                state_city_pattern = _US_STATE_CITY_RE
             else:
-                state_city_pattern = re.compile(r"([^\d\s]+王国)?\s*([^\d\s]+)$")
+                state_city_pattern = _KINGDOM_CITY_RE
 
             state_city_match = state_city_pattern.search(remaining_info)
 
@@ -129,22 +170,23 @@ class DataNormalizer:
                 result["出身地_州/王国"] = state_or_kingdom
                 result["出身地_都市"] = city
 
-        logger.debug(f"抽出された国名、州/王国、および都市名: {result}")
+        logger.debug("抽出された国名、州/王国、および都市名: {}", result)
         return result
 
     @staticmethod
-    def normalize_nationality_info(nationality_info: str) -> List[Dict[str, Any]]:
+    def normalize_nationality_info(nationality_info: Optional[str]) -> List[Dict[str, Any]]:
         """
         国籍情報を期間ごとに分割し、適切な形式に整えるメソッド。
         """
-        logger.debug(f"国籍情報: {nationality_info}")
+        logger.debug("国籍情報: {}", nationality_info)
 
-        # 正規表現を使用して国籍情報を抽出
-        pattern_with_period = re.compile(r"((?:[^\d\s]+(?:\s[^\d\s]+)*)+?)\s(\d{4})-(\d{2,4})")
-        pattern_without_period = re.compile(r"([^\d\s]+(?:\s[^\d\s]+)*)")
+        # 国籍情報がない場合は国名なしとして返す
+        if not nationality_info or nationality_info.isspace():
+            return [{"国籍": []}]
 
-        matches_with_period = pattern_with_period.findall(nationality_info)
-        matches_without_period = pattern_without_period.findall(nationality_info)
+        # 正規表現を使用して国籍情報を抽出
+        matches_with_period = _NATIONALITY_WITH_PERIOD_RE.findall(nationality_info)
+        matches_without_period = _NATIONALITY_WITHOUT_PERIOD_RE.findall(nationality_info)
 
         normalized_nationality: List[Dict[str, Any]] = []
 
@@ -166,22 +208,25 @@ class DataNormalizer:
                 "国籍": countries_list
             })
 
-        logger.debug(f"整形された国籍情報: {normalized_nationality}")
+        logger.debug("整形された国籍情報: {}", normalized_nationality)
         return normalized_nationality
 
     @staticmethod
-    def normalize_children_info(children_info: str) -> List[Dict[str, Optional[Any]]]:
+    def normalize_children_info(children_info: Optional[str]) -> List[Dict[str, Optional[Any]]]:
         """
         子供情報を分割し、名前と年号を抽出するメソッド。
         """
-        logger.debug(f"子供情報: {children_info}")
+        logger.debug("子供情報: {}", children_info)
+
+        if not children_info or children_info.isspace():
+            return []
 
-        children_entries = re.split(r'\s+(?=\D)', children_info)
+        children_entries = _CHILD_ENTRY_SPLIT_RE.split(children_info)
         normalized_children: List[Dict[str, Optional[Any]]] = []
 
         for entry in children_entries:
-            child_name = re.search(r'^[^\d\s]+', entry)
-            birth_death_years = re.findall(r'\d{4}', entry)
+            child_name = _CHILD_NAME_RE.search(entry)
+            birth_death_years = _YEAR_RE.findall(entry)
             death_year_uncertain = '?' in entry
 
             child_dict = {
@@ -192,38 +237,43 @@ class DataNormalizer:
             }
             normalized_children.append(child_dict)
 
-        logger.debug(f"整形された子供情報: {normalized_children}")
+        logger.debug("整形された子供情報: {}", normalized_children)
         return normalized_children
 
     @staticmethod
-    def normalize_field_info(field_info: str) -> List[str]:
+    def normalize_field_info(field_info: Optional[str]) -> List[str]:
         """
         分野情報をリスト形式に変換する。
 
         Args:
-            field_info (str): 分野情報の文字列。
+            field_info (Optional[str]): 分野情報の文字列。
 
         Returns:
             List[str]: リスト形式に変換された分野情報。
         """
+        if not field_info or field_info.isspace():
+            return []
+
         # "・"や空白で区切られた分野情報をリストに変換
-        fields = re.split(r'[・\s]+', field_info)
+        fields = _FIELD_SPLIT_RE.split(field_info)
         return [field.strip() for field in fields if field.strip()]
 
     @staticmethod
-    def normalize_achievements_info(achievements_info: str) -> List[Dict[str, Any]]:
+    def normalize_achievements_info(achievements_info: Optional[str]) -> List[Dict[str, Any]]:
         """
         主な業績情報をリスト形式に変換する。
 
         Args:
-            achievements_info (str): 主な業績情報の文字列。
+            achievements_info (Optional[str]): 主な業績情報の文字列。
 
         Returns:
             List[Dict[str, Any]]: リスト形式に変換された主な業績情報。
         """
+        if not achievements_info or achievements_info.isspace():
+            return []
+
         # 正規表現を使用して賞と年を抽出
-        pattern = re.compile(r"(\D+?)\s+(\d{4})年?")
-        achievements_list = [{"賞": match[0].strip(), "年": int(match[1])} for match in pattern.findall(achievements_info)]
+        achievements_list = [{"賞": match[0].strip(), "年": int(match[1])} for match in _ACHIEVEMENT_RE.findall(achievements_info)]
         return achievements_list
 
 
@@ -11,14 +11,18 @@ from core.data_saver import DataSaver
 from core.date_extractor import DateExtractor
 from core.data_extractor import DataExtractor
 
-configure_logging(level=Config.DEFAULT_LOG_LEVEL)
 logger = get_logger(__name__)
 
+# 追加テーブルの家族情報 ("氏名(関係)")
+_FAMILY_MEMBER_RE = re.compile(r"(.+)\((.+)\)")
+
 class DataProcessor:
     """
     偉人情報のデータセットを作成するクラス。
     """
 
+    __slots__ = ("data", "logger")
+
     def __init__(self):
         self.data = []
         self.logger = get_logger(__name__)
@@ -27,14 +31,20 @@ class DataProcessor:
         """
         ページタイトルリストに基づいてデータを処理し、偉人情報のデータセットを作成する。
         """
-        for page_title in page_titles:
-            scraper = Scraper(page_title=page_title)
+        # ページデータの取得はスレッドで並行して行い、HTML の解析と抽出はページごとに順に行う
+        for page_title, fetch_result in Scraper.fetch_many(page_titles).items():
+            if fetch_result.is_err():
+                self.logger.error(f"Error processing {page_title}: {fetch_result.err_value}")
+                continue
+
+            scraper = fetch_result.ok_value
             try:
-                scraper.fetch_page_data()
-                infobox_data = scraper.extract_infobox_data()
-                logger.debug(f"Extracted infobox data: {infobox_data}")
+                # 画像、Infobox、本文を HTML の 1 回の解析からまとめて抽出する
+                extracted_data = scraper.parse_all()
+                infobox_data = extracted_data["infobox"]
+                logger.debug("Extracted infobox data: {}", infobox_data)
                 processed_item = self._extract_and_format_data(infobox_data)
-                logger.debug(f"Processed item: {processed_item}")
+                logger.debug("Processed item: {}", processed_item)
 
                 # 追加テーブルデータを抽出
                 additional_table_data = scraper.extract_additional_table_data()
@@ -42,7 +52,7 @@ class DataProcessor:
                 if "家族" in additional_table_data:
                     family_members = additional_table_data["家族"]
                     for member in family_members:
-                        match = re.match(r"(.+)\((.+)\)", member)
+                        match = _FAMILY_MEMBER_RE.match(member)
                         if match:
                             name, relation = match.groups()
                             family_info.append({
@@ -55,7 +65,7 @@ class DataProcessor:
 
                 # 家族情報がない場合のみテキストを取得して両親の情報を抽出
                 if not family_info:
-                    sections_data = scraper.extract_text()
+                    sections_data = extracted_data["text"]
                     sections = sections_data.get("sections", [])
                     for section in sections:
                         if isinstance(section, dict):
@@ -64,7 +74,7 @@ class DataProcessor:
                                 text = section.get("text", "")
                                 if text:
                                     parents_info = DataExtractor.extract_parents_info(text)
-                                    logger.debug(f"Extracted parents info: {parents_info}")
+                                    logger.debug("Extracted parents info: {}", parents_info)
 
                                     # 家族構成に両親の情報を追加
                                     if '家族構成' not in processed_item or processed_item['家族構成'] is None:
@@ -109,18 +119,18 @@ class DataProcessor:
                 value = NameExtractor.extract_japanese_name(value)
             elif key == "生年月日":
                 birth_date_info = DateExtractor.extract_and_format_birth_date(value)
-                logger.debug(f"Extracted birth date info: {birth_date_info}")
+                logger.debug("Extracted birth date info: {}", birth_date_info)
                 processed_item.update(birth_date_info)
                 value = birth_date_info["生年月日"]["全体"]
             elif key == "没年月日":
                 death_date_info = DateExtractor.extract_and_format_death_date(value)
-                logger.debug(f"Extracted death date info: {death_date_info}")
+                logger.debug("Extracted death date info: {}", death_date_info)
                 processed_item.update(death_date_info)
                 value = death_date_info["没年月日"]["全体"]
             elif key == "出身地":
-                logger.debug(f"生誕情報: {value}")
+                logger.debug("生誕情報: {}", value)
                 birth_place_info = DataNormalizer.extract_country_from_birth_info(value)
-                logger.debug(f"出身地: {birth_place_info}")
+                logger.debug("出身地: {}", birth_place_info)
                 # 出身地情報を辞書としてまとめる
                 processed_item["出身地"] = {
                     "出身地_国": birth_place_info["出身地_国"],
@@ -129,34 +139,34 @@ class DataProcessor:
                 }
                 continue  # '出身地' キー自体を追加しないようにする
             elif key == "子供":
-                logger.debug(f"子供情報: {value}")
+                logger.debug("子供情報: {}", value)
                 children_info = DataNormalizer.normalize_children_info(value)
                 processed_item["子供"] = children_info
-                logger.debug(f"整形された子供情報: {children_info}")
+                logger.debug("整形された子供情報: {}", children_info)
                 continue  # '子供' キー自体を追加しないようにする
             elif key == "国籍":
-                logger.debug(f"国籍情報: {value}")
+                logger.debug("国籍情報: {}", value)
                 nationality_info = DataNormalizer.normalize_nationality_info(value)
                 processed_item["国籍"] = nationality_info
-                logger.debug(f"整形された国籍情報: {nationality_info}")
+                logger.debug("整形された国籍情報: {}", nationality_info)
                 value = nationality_info
             elif key == "分野":
-                logger.debug(f"分野情報: {value}")
+                logger.debug("分野情報: {}", value)
                 field_info = DataNormalizer.normalize_field_info(value)
                 processed_item["分野"] = field_info
-                logger.debug(f"整形された分野情報: {field_info}")
+                logger.debug("整形された分野情報: {}", field_info)
                 continue  # '分野' キー自体を追加しないようにする
             elif key == "主な業績":
-                logger.debug(f"主な業績情報: {value}")
+                logger.debug("主な業績情報: {}", value)
                 achievements_info = DataNormalizer.normalize_achievements_info(value)
                 processed_item["主な業績"] = achievements_info
-                logger.debug(f"整形された主な業績情報: {achievements_info}")
+                logger.debug("整形された主な業績情報: {}", achievements_info)
                 continue  # '主な業績' キー自体を追加しないようにする
             elif key == "受賞歴":
-                logger.debug(f"主な受賞歴情報: {value}")
+                logger.debug("主な受賞歴情報: {}", value)
                 awards_info = DataNormalizer.normalize_achievements_info(value)
                 processed_item["受賞歴"] = awards_info
-                logger.debug(f"整形された受賞歴情報: {awards_info}")
+                logger.debug("整形された受賞歴情報: {}", awards_info)
                 continue  # '主な受賞歴' キー自体を追加しないようにする
             processed_item[key] = value
 
@@ -165,7 +175,7 @@ class DataProcessor:
             birth_date = birth_date_info["生年月日"]["全体"]
             death_date = death_date_info["没年月日"]["全体"]
             processed_item["死亡年齢"] = DateExtractor.calculate_age_at_death(birth_date, death_date)
-            logger.debug(f"Calculated age at death: {processed_item['死亡年齢']}")
+            logger.debug("Calculated age at death: {}", processed_item['死亡年齢'])
 
         # Ensure detailed date information is included in the final processed item
         if birth_date_info:
@@ -177,6 +187,8 @@ class DataProcessor:
 
 # 使用例
 if __name__ == "__main__":
+    # ロギングの設定は実行時のみ行う (インポートしたモジュールの設定を上書きしないようにする)
+    configure_logging(level=Config.DEFAULT_LOG_LEVEL)
     processor = DataProcessor()
     page_titles = [
         "アルベルト・アインシュタイン",
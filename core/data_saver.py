@@ -1,6 +1,7 @@
-import json
 import os
 from datetime import datetime
+from pathlib import Path
+from utils.utils import dump_json_bytes
 
 class DataSaver:
     """
@@ -20,6 +21,5 @@ class DataSaver:
         if not os.path.exists(directory):
             os.makedirs(directory)
         filename = os.path.join(directory, f"dataset_{data_type}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json")
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(data, f, ensure_ascii=False, indent=4)
+        Path(filename).write_bytes(dump_json_bytes(data))
         print(f"データセットを {filename} に保存しました。")
\ No newline at end of file
@@ -1,11 +1,13 @@
 import re
-from datetime import datetime
 from core.data_normalizer import DataNormalizer
 from utils.logger import get_logger
 from typing import Dict, Optional
 
 logger = get_logger(__name__)
 
+# "YYYY年MM月DD日" 形式の日付
+_DATE_RE = re.compile(r"(\d{4}年\s*\d{1,2}月\s*\d{1,2}日)")
+
 
 class DateExtractor:
     """
@@ -13,18 +15,18 @@ class DateExtractor:
     """
 
     @staticmethod
-    def extract_and_format_birth_date(value: str) -> dict:
+    def extract_and_format_birth_date(value: Optional[str]) -> dict:
         """
         生年月日を抽出してフォーマットする。
         """
-        logger.debug(f"Original birth date value: {value}")
-        date_regex = r"(\d{4}年\s*\d{1,2}月\s*\d{1,2}日)"
-        match = re.search(date_regex, value)
+        logger.debug("Original birth date value: {}", value)
+        # 値がない場合は正規表現を適用せずに不明として扱う
+        match = _DATE_RE.search(value) if value else None
         if match:
             date_str = match.group(1)
             normalized_date = DataNormalizer.normalize_date(date_str)
-            logger.debug(f"Normalized birth date: {normalized_date}")
-            if normalized_date:
+            logger.debug("Normalized birth date: {}", normalized_date)
+            if normalized_date != "不明":
                 year, month, day = normalized_date.split('-')
                 return {
                     "生年月日": {
@@ -44,18 +46,18 @@ class DateExtractor:
         }
 
     @staticmethod
-    def extract_and_format_death_date(value: str) -> dict:
+    def extract_and_format_death_date(value: Optional[str]) -> dict:
         """
         没年月日を抽出してフォーマットする。
         """
-        logger.debug(f"Original death date value: {value}")
-        date_regex = r"(\d{4}年\s*\d{1,2}月\s*\d{1,2}日)"
-        match = re.search(date_regex, value)
+        logger.debug("Original death date value: {}", value)
+        # 値がない場合は正規表現を適用せずに不明として扱う
+        match = _DATE_RE.search(value) if value else None
         if match:
             date_str = match.group(1)
             normalized_date = DataNormalizer.normalize_date(date_str)
-            logger.debug(f"Normalized death date: {normalized_date}")
-            if normalized_date:
+            logger.debug("Normalized death date: {}", normalized_date)
+            if normalized_date != "不明":
                 year, month, day = normalized_date.split('-')
                 return {
                     "没年月日": {
@@ -79,15 +81,14 @@ class DateExtractor:
         """
         生年月日と没年月日から死亡年齢を計算する。
         """
-        logger.debug(f"Calculating age at death with birth_date: {birth_date} and death_date: {death_date}")
+        logger.debug("Calculating age at death with birth_date: {} and death_date: {}", birth_date, death_date)
         if birth_date == "不明" or death_date == "不明":
             return "不明"
 
-        birth_date_obj = datetime.strptime(birth_date, "%Y-%m-%d")
-        death_date_obj = datetime.strptime(death_date, "%Y-%m-%d")
+        birth_year, birth_month, birth_day = map(int, birth_date.split("-"))
+        death_year, death_month, death_day = map(int, death_date.split("-"))
 
-        age_at_death = death_date_obj.year - birth_date_obj.year - (
-                    (death_date_obj.month, death_date_obj.day) < (birth_date_obj.month, birth_date_obj.day))
+        age_at_death = death_year - birth_year - ((death_month, death_day) < (birth_month, birth_day))
 
-        logger.debug(f"Calculated age at death: {age_at_death}")
+        logger.debug("Calculated age at death: {}", age_at_death)
         return str(age_at_death)
\ No newline at end of file
@@ -1,4 +1,20 @@
-import re
+class _JapaneseCharTable(dict):
+    """
+    str.translate 用の変換テーブル。日本語の文字 (ひらがな、カタカナ、漢字、半角カタカナ) はそのまま残し、
+    それ以外の文字は削除する。
+    """
+
+    _RANGES = ((0x3040, 0x309f), (0x30a0, 0x30ff), (0x4e00, 0x9fff), (0xff66, 0xff9f))
+
+    def __init__(self):
+        super().__init__((code_point, code_point) for start, end in self._RANGES for code_point in range(start, end + 1))
+
+    def __missing__(self, code_point: int) -> None:
+        return None
+
+
+_JAPANESE_CHAR_TABLE = _JapaneseCharTable()
+
 
 class NameExtractor:
     """
@@ -11,8 +27,8 @@ class NameExtractor:
         日本語の名前を抽出するメソッド。
         """
         if name:
-            # 日本語の名前を正規表現で抽出
-            japanese_name = re.findall(r'[\u4e00-\u9fff\u3040-\u309f\u30a0-\u30ff\uff66-\uff9f]+', name)
+            # 日本語以外の文字を削除して日本語の名前を抽出
+            japanese_name = name.translate(_JAPANESE_CHAR_TABLE)
             if japanese_name:
-                return ''.join(japanese_name)
-        return "不明"
\ No newline at end of file
+                return japanese_name
+        return "不明"
@@ -1,23 +1,114 @@
-import json
+import functools
 import requests
-from bs4 import BeautifulSoup, Comment, Tag
+from bs4 import BeautifulSoup, Comment, SoupStrainer, Tag
 import re
 import unicodedata
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import timedelta
 import requests_cache
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from config import Config
 from utils.logger import configure_logging, get_logger
-from typing import Any, List, Dict, Union, Optional
-from utils.full_width_converter import FullWidthConverter
+from typing import Any, List, Dict, Iterable, Iterator, Tuple, Union, Optional
+from utils.utils import load_json_bytes, print_json
 from core.data_saver import DataSaver
 from core.data_aggregator import DataAggregator
 from result import Result, Ok, Err
-from core.family_info_manager import FamilyInfoManager
 
-configure_logging(level=Config.DEFAULT_LOG_LEVEL)
 logger = get_logger(__name__)
 
+# 解析対象を絞り込むための SoupStrainer (複数クラスを持つ要素にも一致するよう正規表現で指定)
+_CONTENT_STRAINER = SoupStrainer("div", class_=re.compile(r"(?:^|\s)mw-parser-output(?:\s|$)"))
+_INFOBOX_STRAINER = SoupStrainer("table", class_=re.compile(r"(?:^|\s)infobox(?:\s|$)"))
+_NAVBOX_STRAINER = SoupStrainer("div", class_=re.compile(r"(?:^|\s)navbox(?:\s|$)"))
+_IMAGE_STRAINER = SoupStrainer("img")
+
+# 本文から削除する要素 (不要なタグと無視するクラス) の CSS セレクタ
+_REMOVAL_SELECTOR = ", ".join(Config.UNNECESSARY_TAGS + [f".{class_name}" for class_name in Config.IGNORE_CLASSES])
+
+# 見出しクラス (mw-heading2 など) から見出しレベルへの対応表
+_HEADING_LEVEL_BY_CLASS = {class_name: int(class_name.removeprefix("mw-heading")) for class_name in Config.HEADING_LEVELS}
+
+# テキスト整形用の正規表現
+_NOISE_RE = re.compile(r"\[編集\]|\[\d+\]|\[要出典\]")  # セクション編集リンク、脚注・出典記号
+_PLAINTEXT_HEADING_RE = re.compile(r"^(={2,6})\s*([^=].*?)\s*\1$")  # プレーンテキスト抽出の見出し行 (== 見出し ==)
+# 削除する記号類 (str.translate 用の削除テーブル)。NFKC 正規化後に適用するため、
+# 全角英数記号や「…」など NFKC で ASCII に変換される文字は含めない
+_PUNCTUATION_DELETE_TABLE = str.maketrans("", "", "!\"#$%&'()*+,-./:;<=>?@[\\]^_`{|}~”「」‘’©®—–")
+
+
+def _normalize_nfkc(text: str) -> str:
+    """
+    テキストを NFKC 形式に正規化する。ASCII のみのテキストは正規化しても変わらないため、そのまま返す。
+    """
+    return text if text.isascii() else unicodedata.normalize("NFKC", text)
+
+
+def _clean_text_uncached(text: str) -> str:
+    """
+    テキストを正規化 (NFKC) し、不要な記号・文字列 (セクション編集リンク、脚注・出典記号、記号類) を削除して、空白を整える。
+
+    NFKC により半角カタカナは全角に、全角英数字・記号・スペースは半角に統一されるため、全角/半角の変換は別に行わない。
+    """
+    text = _normalize_nfkc(text)
+    text = _NOISE_RE.sub("", text)
+    text = text.translate(_PUNCTUATION_DELETE_TABLE)
+    return " ".join(text.split())  # 連続する空白文字（全角スペース、タブ、改行含む）を一つの半角スペースに置換し、前後の空白を除去
+
+
+# 見出しテキストは同じ文字列が繰り返し整形されるため、結果をキャッシュする (本文は巨大かつ一意なのでキャッシュしない)
+_clean_text_cached = functools.lru_cache(maxsize=4096)(_clean_text_uncached)
+
+
+def _compile_keyword_pattern(keywords: Iterable[str]) -> "re.Pattern[str]":
+    """
+    キーワードのいずれかを含むかを一度の走査で判定する正規表現を作成する。
+
+    Args:
+        keywords (Iterable[str]): キーワードのリスト。
+
+    Returns:
+        re.Pattern[str]: キーワードの選択パターン。キーワードが空の場合は何にもマッチしないパターン。
+    """
+    unique_keywords = dict.fromkeys(keyword for keyword in keywords if keyword)
+    if not unique_keywords:
+        return re.compile(r"(?!)")
+    return re.compile("|".join(map(re.escape, unique_keywords)))
+
+
+# 記事のテキストに関連するキーワード (カテゴリ名の除外判定用)
+_ARTICLE_KEYWORDS_RE = _compile_keyword_pattern(["記事", "テキスト"])
+
+
+class _CellCharTable(dict):
+    """
+    Infobox セル用の str.translate 変換テーブル。英数字、空白、ひらがな、カタカナ、漢字、
+    記号 (.,?!-) はそのまま残し、それ以外の文字は削除する。
+    判定結果は初回参照時にキャッシュする。
+    """
+
+    _RANGES = ((0x3040, 0x309f), (0x30a0, 0x30ff), (0x4e00, 0x9fff))
+    _ALLOWED_SYMBOLS = frozenset("_.,?!-")
+
+    def __missing__(self, code_point: int) -> Optional[int]:
+        char = chr(code_point)
+        if (
+            char.isalnum()
+            or char.isspace()
+            or char in self._ALLOWED_SYMBOLS
+            or any(start <= code_point <= end for start, end in self._RANGES)
+        ):
+            value: Optional[int] = code_point
+        else:
+            value = None
+        self[code_point] = value
+        return value
+
+
+_CELL_CHAR_TABLE = _CellCharTable()
+
 class Scraper:
     """
     Wikipedia ページから情報をスクレイピングするクラス。
@@ -27,6 +118,32 @@ class Scraper:
         wikipedia_url (str, optional): Wikipedia ページの URL。指定されない場合は、page_title から自動生成される。
     """
 
+    # インスタンス属性を固定し、インスタンスごとの __dict__ を持たないようにする
+    __slots__ = (
+        "page_id",
+        "soup",
+        "page_title",
+        "wikipedia_url",
+        "session",
+        "cache_headers",
+        "page_content",
+        "_parse_payload",
+        "infobox_data",
+        "text_data",
+        "image_data",
+        "categories",
+        "site_url",
+        "exclude_words",
+        "excluded_section_keywords",
+    )
+
+    # 全インスタンスで共有する HTTP セッション (キャッシュと接続プールを使い回す)
+    _shared_session: Optional[requests.Session] = None
+
+    # 除外ワードと除外セクションのキーワードの選択パターン (Config を変更した場合は _refresh_exclude_re() で作り直す)
+    _EXCLUDE_WORDS_RE = _compile_keyword_pattern(Config.EXCLUDE_WORDS)
+    _EXCLUDED_SECTION_RE = _compile_keyword_pattern(Config.EXCLUDED_SECTION_KEYWORDS)
+
     def __init__(self, page_title: str, wikipedia_url: Optional[str] = None):
         """
         Scraper クラスのコンストラクタ。
@@ -40,27 +157,92 @@ class Scraper:
         self.page_title = page_title
         self.wikipedia_url = wikipedia_url or f"https://ja.wikipedia.org/wiki/{page_title}"
 
-        cache_name = 'wiki_cache'
-        expire_after = timedelta(days=7)
-        requests_cache.install_cache(
-            cache_name,
-            backend='mongodb',
-            expire_after=expire_after,
-            connection=None
-        )
-        self.session = requests.Session()
+        self.session = self._get_shared_session()
         self.cache_headers: Dict[str, Dict[str, str]] = {}
 
         self.page_content: Optional[str] = None
-        self.infobox_data: Dict[str, str] = {}
-        self.text_data: Dict[str, List[str]] = {}
-        self.image_data: List[Dict[str, Optional[str]]] = []
-        self.categories: List[str] = []
+        self._parse_payload: Optional[Dict[str, Any]] = None
+        # 抽出結果はインスタンスに保持し、同じページに対する再抽出を省く
+        self.infobox_data: Optional[Dict[str, str]] = None
+        self.text_data: Dict[Tuple[Any, ...], Dict[str, List[Dict[str, Any]]]] = {}  # 抽出方法と (normalize_text, remove_exclude_words) ごと
+        self.image_data: Optional[List[Dict[str, Optional[str]]]] = None  # 本文整形前の解析結果から抽出する
+        self.categories: Optional[List[str]] = None
         self.site_url = Config.BASE_URL
         self.exclude_words: List[str] = Config.EXCLUDE_WORDS
         self.excluded_section_keywords: List[str] = Config.EXCLUDED_SECTION_KEYWORDS
 
+    @classmethod
+    def _refresh_exclude_re(cls):
+        """
+        Config.EXCLUDE_WORDS または Config.EXCLUDED_SECTION_KEYWORDS を変更した場合に、除外用の選択パターンを作り直す。
+        """
+        cls._EXCLUDE_WORDS_RE = _compile_keyword_pattern(Config.EXCLUDE_WORDS)
+        cls._EXCLUDED_SECTION_RE = _compile_keyword_pattern(Config.EXCLUDED_SECTION_KEYWORDS)
+
     # ----------------------- データ取得とキャッシュ処理 -----------------------
+    @classmethod
+    def _get_shared_session(cls) -> requests.Session:
+        """
+        全インスタンスで共有する HTTP セッションを取得する。初回呼び出し時にのみ作成する。
+
+        レスポンスは requests_cache (既定は SQLite バックエンド) にキャッシュし、
+        同一ホストへの接続は HTTPAdapter の接続プールで再利用する。
+
+        Returns:
+            requests.Session: 共有 HTTP セッション。
+        """
+        if cls._shared_session is None:
+            session = requests_cache.CachedSession(
+                Config.CACHE_NAME,
+                backend=Config.CACHE_BACKEND,
+                expire_after=timedelta(days=Config.CACHE_EXPIRE_DAYS),
+            )
+            retry = Retry(
+                total=Config.HTTP_MAX_RETRIES,
+                backoff_factor=Config.HTTP_BACKOFF_FACTOR,
+                status_forcelist=Config.HTTP_RETRY_STATUS_CODES,
+            )
+            adapter = HTTPAdapter(
+                pool_connections=Config.HTTP_POOL_CONNECTIONS,
+                pool_maxsize=Config.HTTP_POOL_MAXSIZE,
+                max_retries=retry,
+            )
+            session.mount("https://", adapter)
+            session.headers["Accept-Encoding"] = "gzip"
+            session.headers["User-Agent"] = Config.USER_AGENT
+            cls._shared_session = session
+        return cls._shared_session
+
+    @classmethod
+    def fetch_many(cls, page_titles: List[str], max_workers: int = Config.FETCH_MAX_WORKERS) -> Dict[str, Result["Scraper", str]]:
+        """
+        複数の Wikipedia ページのデータを並行して取得する。
+
+        各ページの fetch_page_data() をスレッドプールで実行し、共有 HTTP セッションの接続プールを使い回す。
+
+        Args:
+            page_titles (List[str]): Wikipedia ページのタイトルのリスト。
+            max_workers (int, optional): 同時に実行するリクエストの最大数。
+
+        Returns:
+            Dict[str, Result[Scraper, str]]: ページタイトルをキー、取得に成功した場合は Ok(Scraper)、
+                失敗した場合は Err(エラーメッセージ) を値とする辞書。順序は page_titles と同じ。
+        """
+        scrapers = [cls(page_title=page_title) for page_title in page_titles]
+        results: Dict[str, Result[Scraper, str]] = {}
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(scraper.fetch_page_data) for scraper in scrapers]
+            for scraper, future in zip(scrapers, futures):
+                # 想定外の例外はそのページのみの失敗として扱い、他のページの結果は失わない
+                try:
+                    fetch_result = future.result()
+                except Exception as e:
+                    logger.error(f"ページデータ取得中の予期しないエラー: {scraper.page_title}: {e!r}")
+                    results[scraper.page_title] = Err(f"予期しないエラー: {e!r}")
+                    continue
+                results[scraper.page_title] = Ok(scraper) if fetch_result.is_ok() else Err(fetch_result.err_value)
+        return results
+
     def fetch_page_data(self) -> Result[None, str]:
         """
         Wikipedia API からページデータを取得し、レスポンスヘッダーを処理する。
@@ -79,12 +261,12 @@ class Scraper:
             "action": "parse",
             "format": "json",
             "page": self.page_title,
-            "prop": "text",
+            "prop": "text|categories",
             "redirects": "true"
         }
 
         try:
-            response = self.session.get(self.site_url, params=params, headers=headers)
+            response = self.session.get(self.site_url, params=params, headers=headers, timeout=Config.HTTP_TIMEOUT)
 
             if response.from_cache:
                 logger.info(f"キャッシュからデータを取得: {self.page_title}")
@@ -96,7 +278,7 @@ class Scraper:
             if self._process_response_headers(response):
                 return Ok(None)
 
-            data = response.json()
+            data = load_json_bytes(response.content)
 
             if "error" in data:
                 error_info = data["error"]["info"]
@@ -107,8 +289,10 @@ class Scraper:
                 logger.error(f"ページが見つかりません: {self.page_title}")
                 return Err(f"ページが見つかりません: {self.page_title}")
 
+            self._parse_payload = data["parse"]
             self.page_id = data["parse"]["pageid"]
             self.page_content = data["parse"]["text"]["*"]
+            self._clear_extracted_data()
             logger.info(f"ページデータを取得しました: page_id={self.page_id}")
 
             return Ok(None)
@@ -122,6 +306,16 @@ class Scraper:
             self.page_id = None
             return Err(str(e))
 
+    def _clear_extracted_data(self):
+        """
+        ページデータを取得し直した場合に、保持している解析結果と抽出結果を破棄する。
+        """
+        self.soup = None
+        self.infobox_data = None
+        self.text_data = {}
+        self.image_data = None
+        self.categories = None
+
     def _set_cache_headers(self, headers: Dict[str, str]):
         """
         キャッシュヘッダー (If-None-Match, If-Modified-Since) を設定する。
@@ -162,6 +356,18 @@ class Scraper:
             logger.info(f"ETag と Last-Modified ヘッダーを保存: {self.cache_headers[self.page_title]}")
         return False
 
+    def _get_soup(self) -> BeautifulSoup:
+        """
+        本文領域 (mw-parser-output) のみを解析した BeautifulSoup オブジェクトを取得する。
+        解析結果はインスタンスに保持し、以降の呼び出しで再利用する。
+
+        Returns:
+            BeautifulSoup: 本文領域の BeautifulSoup オブジェクト。
+        """
+        if self.soup is None:
+            self.soup = BeautifulSoup(self.page_content, "lxml", parse_only=_CONTENT_STRAINER)
+        return self.soup
+
     def extract_additional_table_data(self) -> Dict[str, Union[str, List[str]]]:
         """
         Wikipedia ページの特定のテーブルデータを抽出する。
@@ -174,11 +380,11 @@ class Scraper:
             logger.error(Config._FETCH_PAGE_DATA_ERROR_MESSAGE)
             raise ValueError(Config._FETCH_PAGE_DATA_ERROR_MESSAGE)
 
-        self.soup = BeautifulSoup(self.page_content, "lxml")
+        soup = BeautifulSoup(self.page_content, "lxml", parse_only=_NAVBOX_STRAINER)
         additional_data: Dict[str, Union[str, List[str]]] = {}
 
         # aria-labelledby属性を使用して特定のdivを抽出
-        divs = self.soup.select(f"div.navbox[aria-labelledby='{self.page_title}']")
+        divs = soup.select(f"div.navbox[aria-labelledby='{self.page_title}']")
         for div in divs:
             tables = div.find_all("table")
             for table in tables:
@@ -216,8 +422,16 @@ class Scraper:
             logger.error(Config._FETCH_PAGE_DATA_ERROR_MESSAGE)
             raise ValueError(Config._FETCH_PAGE_DATA_ERROR_MESSAGE)
 
-        self.soup = BeautifulSoup(self.page_content, "lxml")
-        infobox = self.soup.find("table", class_=["infobox", "infobox vcard", "infobox biography vcard"])
+        if self.infobox_data is not None:
+            logger.info("Infobox データ抽出完了 (抽出済みのデータを使用)")
+            return self.infobox_data
+
+        # 本文領域を解析済みであれば再利用し、未解析であれば Infobox のみを解析する
+        if self.soup is not None:
+            soup = self.soup
+        else:
+            soup = BeautifulSoup(self.page_content, "lxml", parse_only=_INFOBOX_STRAINER)
+        infobox = soup.find("table", class_="infobox")
 
         infobox_data: Dict[str, str] = {}
 
@@ -227,6 +441,7 @@ class Scraper:
         else:
             infobox_data["名前"] = self.page_title
 
+        self.infobox_data = infobox_data
         logger.info("Infobox データ抽出完了")
         return infobox_data
 
@@ -262,10 +477,9 @@ class Scraper:
             header: Optional[Tag] = row.find("th")
             value_cell: Optional[Tag] = row.find("td")
             if header and value_cell:
-                key = header.get_text(strip=True) if header and header.get_text(strip=True) else None
+                key = header.get_text(strip=True)
                 if key:
-                    value: str = self._extract_text_from_cell(value_cell)
-                    rows_data[key] = value
+                    rows_data[key] = self._extract_text_from_cell(value_cell)
         return rows_data
 
     def _extract_text_from_cell(self, cell: Tag) -> str:
@@ -289,19 +503,13 @@ class Scraper:
 
         text = ", ".join(extracted_texts)
 
-        text = unicodedata.normalize("NFKC", text)
-        text = re.sub(r"\s+", " ", text)
-        text = text.strip()
-        text = re.sub(Config.FULL_WIDTH_SPACE, " ", text)
-        pattern = r"[^\w\s\u3040-\u309f\u30a0-\u30ff\u4e00-\u9fff.,?!-]"
-        text = re.sub(pattern, "", text)
-        text = FullWidthConverter.convert_to_fullwidth(text)  # 全角に統一
+        # NFKC で全角/半角が統一されるため、全角/半角の変換は別に行わない
+        text = _normalize_nfkc(text)
+        text = text.translate(_CELL_CHAR_TABLE)
+        text = " ".join(text.split())  # 文字の削除で生じた連続する空白もまとめて置換
 
         # 除外ワードを削除
-        for word in self.exclude_words:
-            text = text.replace(word, "")
-
-        return text
+        return self._remove_words(text, self.exclude_words)
 
     # ----------------------- 画像データ抽出 -----------------------
     def extract_image_data(self) -> List[Dict[str, Optional[str]]]:
@@ -319,29 +527,84 @@ class Scraper:
             logger.error(Config._FETCH_PAGE_DATA_ERROR_MESSAGE)
             raise ValueError(Config._FETCH_PAGE_DATA_ERROR_MESSAGE)
 
-        if self.soup is None:
-            self.soup = BeautifulSoup(self.page_content, "lxml")
-        images = self.soup.find_all("img")
-        image_data_list: List[Dict[str, Optional[str]]] = []
-
-        for img in images:
-            image_url = img.get("src")
-            alt_text = img.get("alt")
-            if image_url:
-                image_data_list.append({"image_url": image_url, "alt_text": alt_text})
+        image_data_list = self._collect_image_data()
 
         logger.info(f"画像データ抽出完了: 取得画像数={len(image_data_list)}")
         return image_data_list
 
+    def _collect_image_data(self) -> List[Dict[str, Optional[str]]]:
+        """
+        本文領域の画像 (img) の URL と代替テキストを抽出する。
+
+        extract_text() は不要な要素を削除して解析結果を書き換えるため、画像データは書き換え前に一度だけ抽出し、
+        インスタンスに保持する。
+
+        Returns:
+            List[Dict[str, Optional[str]]]: 画像データを格納したリスト (辞書のリスト)。
+        """
+        if self.image_data is None:
+            # 本文領域を解析済みであれば再利用し、未解析であれば img 要素のみを解析する
+            if self.soup is not None:
+                soup = self.soup
+            else:
+                soup = BeautifulSoup(self.page_content, "lxml", parse_only=_IMAGE_STRAINER)
+            self.image_data = [
+                {"image_url": img.get("src"), "alt_text": img.get("alt")}
+                for img in soup.find_all("img")
+                if img.get("src")
+            ]
+        return self.image_data
+
+    def parse_all(self) -> Dict[str, Any]:
+        """
+        画像データ、Infobox データ、本文と見出しを、HTML を一度だけ解析してまとめて抽出する。
+
+        解析結果を書き換える本文の抽出を最後に行うため、画像と Infobox は書き換え前の解析結果から抽出される。
+
+        Returns:
+            Dict[str, Any]: "images"、"infobox"、"text" をキーとする抽出結果の辞書。
+
+        Raises:
+            ValueError: HTMLコンテンツが存在しない場合。
+        """
+        if not self.page_content:
+            logger.error(Config._FETCH_PAGE_DATA_ERROR_MESSAGE)
+            raise ValueError(Config._FETCH_PAGE_DATA_ERROR_MESSAGE)
+
+        self._get_soup()
+        images = self.extract_image_data()
+        infobox = self.extract_infobox_data()
+        text = self.extract_text()
+        return {"images": images, "infobox": infobox, "text": text}
+
     # ----------------------- カテゴリデータ抽出 -----------------------
     def extract_categories(self) -> List[str]:
         """
-        Wikipedia API を使用して、Wikipedia ページのカテゴリデータを抽出する。
+        Wikipedia ページのカテゴリデータを抽出する。
+
+        fetch_page_data() で取得済みの parse レスポンスにカテゴリが含まれていればそれを使用し、
+        含まれていない場合のみ Wikipedia API にカテゴリを問い合わせる。
 
         Returns:
             List[str]: カテゴリ名のリスト。
         """
         logger.info(f"カテゴリデータ抽出開始: {self.page_title}")
+        if self.categories is not None:
+            logger.info(f"カテゴリデータ抽出完了 (抽出済みのデータを使用): {self.page_title}")
+            return self.categories
+
+        parsed_categories = self._parse_payload.get("categories") if self._parse_payload else None
+        if parsed_categories is not None:
+            categories = []
+            for category in parsed_categories:
+                # parse の結果は名前空間なし・空白がアンダースコアのため、query と同じ形式に揃える
+                category_title = f"Category:{category['*'].replace('_', ' ')}"
+                if not self._contains_article_text(category_title):
+                    categories.append(category_title)
+            self.categories = categories
+            logger.info(f"カテゴリデータ抽出完了: {self.page_title} - {len(categories)} 件のカテゴリを取得")
+            return categories
+
         params = {
             "action": "query",
             "format": "json",
@@ -351,9 +614,9 @@ class Scraper:
         }
 
         try:
-            response = self.session.get(self.site_url, params=params)
+            response = self.session.get(self.site_url, params=params, timeout=Config.HTTP_TIMEOUT)
             response.raise_for_status()
-            data = response.json()
+            data = load_json_bytes(response.content)
 
             categories: List[str] = []
             pages = data.get("query", {}).get("pages", {})
@@ -364,6 +627,7 @@ class Scraper:
                         if not self._contains_article_text(category_title):
                             categories.append(category_title)
 
+            self.categories = categories
             logger.info(f"カテゴリデータ抽出完了: {self.page_title} - {len(categories)} 件のカテゴリを取得")
             return categories
 
@@ -387,9 +651,7 @@ class Scraper:
         Returns:
             bool: 記事のテキストが含まれている場合は True、含まれていない場合は False。
         """
-        # 記事のテキストに関連するキーワードリスト
-        article_keywords = ["記事", "テキスト"]
-        return any(keyword in text for keyword in article_keywords)
+        return _ARTICLE_KEYWORDS_RE.search(text) is not None
 
     # ----------------------- 本文と見出しの抽出 -----------------------
     def extract_text(self, normalize_text: bool = True, remove_exclude_words: bool = True) -> Dict[str, List[Dict[str, Union[str, List[str]]]]]:
@@ -411,285 +673,260 @@ class Scraper:
             logger.error(Config._FETCH_PAGE_DATA_ERROR_MESSAGE)
             raise ValueError(Config._FETCH_PAGE_DATA_ERROR_MESSAGE)
 
-        if self.soup is None:
-            self.soup = BeautifulSoup(self.page_content, 'lxml')
-
-        self._remove_unnecessary_elements(self.soup)
-        sections = self._extract_headings_and_body(self.soup)
-        sections = self._remove_excluded_sections(sections)
-
-        if normalize_text:
-            processed_sections = self._post_process_text_for_category(sections)
-        else:
-            processed_sections = sections
+        cache_key = (normalize_text, remove_exclude_words)
+        cached_text_data = self.text_data.get(cache_key)
+        if cached_text_data is not None:
+            logger.info("本文と見出し抽出完了 (抽出済みのデータを使用)")
+            return cached_text_data
 
-        if remove_exclude_words:
-            processed_sections = self._remove_exclude_words_for_category(processed_sections)
+        soup = self._get_soup()
+        self._collect_image_data()  # 不要な要素を削除する前に画像データを確保する
+        self._remove_unnecessary_elements(soup)
+        sections = self._extract_headings_and_body(soup)
+        processed_sections = self._finalize_sections(sections, normalize_text, remove_exclude_words)
 
+        text_data = {"sections": processed_sections}
+        self.text_data[cache_key] = text_data
         logger.info("本文と見出し抽出完了")
-        return {"sections": processed_sections}
+        return text_data
 
-    def _remove_unnecessary_elements(self, soup: BeautifulSoup):
+    def extract_text_fast(self, normalize_text: bool = True, remove_exclude_words: bool = True) -> Dict[str, List[Dict[str, Union[str, List[str]]]]]:
         """
-        BeautifulSoup オブジェクトから不要な HTML 要素を削除する。
+        Wikipedia API のプレーンテキスト抽出 (prop=extracts) を使用して、本文と見出しを抽出する。
 
-        Args:
-            soup (BeautifulSoup): BeautifulSoup オブジェクト。
-        """
+        HTML を解析しないため extract_text() より高速に動作する。出力形式は extract_text() と同じ。
+        プレーンテキストが取得できない場合、または切り詰められている場合は extract_text() にフォールバックする。
+        抽出結果はインスタンスに保持し、同じ引数での再呼び出しでは API に問い合わせない。
 
-        # 指定されたタグを削除
-        for tag_name in Config.UNNECESSARY_TAGS:
-            for tag in soup.find_all(tag_name):
-                tag.decompose()
+        Args:
+            normalize_text (bool, optional): テキストを正規化するかどうか。デフォルトは True。
+            remove_exclude_words (bool, optional): 除外ワードを削除するかどうか。デフォルトは True。
 
-        # コメントを削除
-        for comment in soup.find_all(string=lambda text: isinstance(text, Comment)):
-            comment.extract()
+        Returns:
+            Dict[str, List[Dict[str, Union[str, List[str]]]]]: 見出しと本文を格納した辞書。
 
-        # 無視するクラスを持つ要素を削除
-        for class_name in Config.IGNORE_CLASSES:
-            for tag in soup.find_all(class_=class_name):
-                tag.decompose()
+        Raises:
+            ValueError: API リクエストに失敗した場合、またはフォールバック時に HTML コンテンツが存在しない場合。
+        """
+        logger.info(f"本文と見出し抽出開始 (プレーンテキスト): {self.page_title}")
+        cache_key = ("plaintext", normalize_text, remove_exclude_words)
+        cached_text_data = self.text_data.get(cache_key)
+        if cached_text_data is not None:
+            logger.info("本文と見出し抽出完了 (抽出済みのデータを使用)")
+            return cached_text_data
 
+        params = {
+            "action": "query",
+            "format": "json",
+            "titles": self.page_title,
+            "prop": "extracts|info",
+            "explaintext": "1",
+            "exsectionformat": "wiki",
+            "redirects": "1"
+        }
 
-    def _extract_headings_and_body(self, soup: BeautifulSoup) -> List[Dict[str, Any]]:
-        """
-        BeautifulSoup オブジェクトから階層的な見出し (h2, h3, h4) と本文を抽出する。
-        テキスト分析しやすいフラットなリスト構造で出力する。
-        """
-        sections: List[Dict[str, Any]] = []
-        h2_heading_divs = soup.find_all('div', class_='mw-heading mw-heading2')
+        try:
+            response = self.session.get(self.site_url, params=params, timeout=Config.HTTP_TIMEOUT)
+            response.raise_for_status()
+            data = load_json_bytes(response.content)
+        except requests.exceptions.RequestException as e:
+            logger.error(f"リクエストエラー: {e}")
+            raise ValueError(f"リクエストエラー: {e}") from e
 
-        for h2_heading_div in h2_heading_divs:
-            section_data_h2 = self._extract_section_content_with_category(h2_heading_div, [])
-            if section_data_h2:
-                sections.append(section_data_h2)
-                h3_sections = self._extract_h3_sections(h2_heading_div)
-                if h3_sections:
-                    sections.extend(h3_sections)
+        page_data = next(iter(data.get("query", {}).get("pages", {}).values()), {})
+        extract = page_data.get("extract")
+        if not extract:
+            logger.warning(f"プレーンテキストを取得できないため HTML から抽出します: {self.page_title}")
+            text_data = self.extract_text(normalize_text, remove_exclude_words)
+        elif self._is_truncated_extract(data, extract, page_data.get("length")):
+            logger.warning(f"プレーンテキストが切り詰められているため HTML から抽出します: {self.page_title}")
+            text_data = self.extract_text(normalize_text, remove_exclude_words)
+        else:
+            sections = self._build_sections(self._iter_plaintext_blocks(extract))
+            text_data = {"sections": self._finalize_sections(sections, normalize_text, remove_exclude_words)}
+            logger.info("本文と見出し抽出完了 (プレーンテキスト)")
 
-        return sections
+        self.text_data[cache_key] = text_data
+        return text_data
 
-    def _extract_h3_sections(self, h2_heading_div: Tag) -> List[Dict[str, Any]]:
+    @staticmethod
+    def _is_truncated_extract(data: Dict[str, Any], extract: str, page_length: Optional[int]) -> bool:
         """
-        h2 見出しの次の h3 および h4 見出しまでのセクションを抽出する。
+        プレーンテキスト抽出が切り詰められているかどうかを判定する。
+
+        続きがある場合 (レスポンスに "continue" を含む) と、ページ (ウィキテキスト) のバイト数に対して
+        プレーンテキストが極端に短い場合は、切り詰められたものとして扱う。
 
         Args:
-            h2_heading_div (BeautifulSoup): h2 見出しの div 要素。
+            data (Dict[str, Any]): API レスポンス。
+            extract (str): プレーンテキスト。
+            page_length (Optional[int]): ページのバイト数 (prop=info の length)。
 
         Returns:
-            List[Dict[str, Any]]: h3 および h4 見出しのセクションデータのリスト。
+            bool: 切り詰められている場合は True。
         """
-        sections: List[Dict[str, Any]] = []
-        next_sibling = h2_heading_div.find_next_sibling()
-        current_category_path = [h2_heading_div.get_text(strip=True)]
-
-        while next_sibling and not self._is_h2_heading(next_sibling):
-            if self._is_h3_heading(next_sibling):
-                section_data_h3 = self._extract_section_content_with_category(next_sibling, current_category_path)
-                if section_data_h3:
-                    sections.append(section_data_h3)
-                    h4_sections = self._extract_h4_sections(next_sibling,
-                                                            current_category_path + [next_sibling.get_text(strip=True)])
-                    if h4_sections:
-                        sections.extend(h4_sections)
-            next_sibling = next_sibling.find_next_sibling()
-
-        return sections
+        if "continue" in data:
+            return True
+        if page_length:
+            return len(extract.encode("utf-8")) < page_length * Config.PLAINTEXT_MIN_LENGTH_RATIO
+        return False
 
-    def _extract_h4_sections(self, h3_heading_div: Tag, current_category_path: List[str]) -> List[Dict[str, Any]]:
+    def _finalize_sections(self, sections: List[Dict[str, Any]], normalize_text: bool, remove_exclude_words: bool) -> List[Dict[str, Any]]:
         """
-        h3 見出しの次の h4 見出しまでのセクションを抽出する。
+        抽出したセクションから除外セクションを削除し、必要に応じて正規化と除外ワードの削除を行う。
 
         Args:
-            h3_heading_div (BeautifulSoup): h3 見出しの div 要素。
-            current_category_path (List[str]): 現在のカテゴリパス。
+            sections (List[Dict[str, Any]]): 抽出されたセクションデータのリスト。
+            normalize_text (bool): テキストを正規化するかどうか。
+            remove_exclude_words (bool): 除外ワードを削除するかどうか。
 
         Returns:
-            List[Dict[str, Any]]: h4 見出しのセクションデータのリスト。
+            List[Dict[str, Any]]: 処理後のセクションデータのリスト。
         """
-        sections: List[Dict[str, Any]] = []
-        next_sibling = h3_heading_div.find_next_sibling()
-
-        while next_sibling and not self._is_h3_heading(next_sibling):
-            if self._is_h4_heading(next_sibling):
-                section_data_h4 = self._extract_section_content_with_category(next_sibling, current_category_path)
-                if section_data_h4:
-                    sections.append(section_data_h4)
-            next_sibling = next_sibling.find_next_sibling()
-
-        return sections
+        sections = self._remove_excluded_sections(sections)
 
-    def _is_h2_heading(self, sibling: Tag) -> bool:
-        return sibling.name == 'div' and 'mw-heading' in sibling.get('class', []) and 'mw-heading2' in sibling.get('class', [])
+        if normalize_text:
+            sections = self._post_process_text_for_category(sections)
 
-    def _is_h3_heading(self, sibling: Tag) -> bool:
-        return sibling.name == 'div' and 'mw-heading' in sibling.get('class', []) and 'mw-heading3' in sibling.get('class', [])
+        if remove_exclude_words:
+            sections = self._remove_exclude_words_for_category(sections)
 
-    def _is_h4_heading(self, sibling: Tag) -> bool:
-        return sibling.name == 'div' and 'mw-heading' in sibling.get('class', []) and 'mw-heading4' in sibling.get('class', [])
+        return sections
 
-    def _extract_section_content_with_category(self, heading_div_h: Tag, category_path: List[str]) -> Dict[str, Any]:
+    def _remove_unnecessary_elements(self, soup: BeautifulSoup):
         """
-        セクション (h2, h3, h4) の内容を抽出する共通メソッド (カテゴリテキスト対応)。
-        フラットなリスト構造のセクションデータを作成する。
+        BeautifulSoup オブジェクトから不要な HTML 要素を削除する。
 
         Args:
-            heading_div_h (BeautifulSoup): 見出しの div 要素。
-            category_path (List[str]): カテゴリパス。
-
-        Returns:
-            Dict[str, Any]: 抽出されたセクションデータ。
-        """
-        text_content_list: List[str] = []
-        sibling = heading_div_h.find_next_sibling()
-        next_heading_levels = Config.HEADING_LEVELS
-        current_heading_level_class = self.get_heading_level_class(heading_div_h)
-        current_heading_level = heading_div_h.find('h2') or heading_div_h.find('h3') or heading_div_h.find('h4')
-        heading_level_tag = current_heading_level.name if current_heading_level else 'h2'
-        heading_text = self._extract_heading_text(heading_div_h, heading_level_tag)
-
-        # Clean category text
-        cleaned_category_path = [self._clean_text(text) for text in category_path + [heading_text]]
-        heading_level = int(heading_level_tag[1]) if heading_level_tag else 2
-
-        sibling_processors = {
-            '_is_h3_heading': self._process_h3_section_with_category,
-            '_is_h4_heading': self._process_h4_section_with_category,
-        }
-        sections: List[Dict[str, Any]] = []
+            soup (BeautifulSoup): BeautifulSoup オブジェクト。
+        """
 
-        current_content_siblings = []
-        temp_sibling = heading_div_h.find_next_sibling()
-        while temp_sibling:
-            if self._is_next_heading_level(temp_sibling, next_heading_levels, current_heading_level_class):
-                break
-            current_content_siblings.append(temp_sibling)
-            temp_sibling = temp_sibling.find_next_sibling()
-
-        for current_content_sibling in current_content_siblings:
-            sub_section_data = self._process_sibling_element_with_category(current_content_sibling, sibling_processors,
-                                                                            cleaned_category_path)
-            if sub_section_data:
-                sections.append(sub_section_data)
-            elif self._is_paragraph_element(current_content_sibling):
-                paragraph_text = self._extract_paragraph_text(current_content_sibling)
-                if paragraph_text:
-                    section_data = {
-                        "category_texts": cleaned_category_path,
-                        "heading_level": heading_level + 1,
-                        "heading_text": None,
-                        "text": paragraph_text
-                    }
-                    sections.append(section_data)
-            elif current_content_sibling.name == 'figure':
-                figure_text = str(current_content_sibling)
-                section_data = {
-                    "category_texts": cleaned_category_path,
-                    "heading_level": heading_level + 1,
-                    "heading_text": "Figure",
-                    "text": figure_text
-                }
-                sections.append(section_data)
-            else:
-                other_text = current_content_sibling.get_text(separator=" ", strip=True)
-                if other_text:
-                    section_data = {
-                        "category_texts": cleaned_category_path,
-                        "heading_level": heading_level + 1,
-                        "heading_text": None,
-                        "text": other_text
-                    }
-                    sections.append(section_data)
-
-        section_text_content_list = []
-        for section_item in sections:
-            if section_item["heading_text"] is None and section_item["text"]:
-                section_text_content_list.append(section_item["text"])
-        text_content = "\n".join(section_text_content_list).strip()
-
-        section_data = {
-            "category_texts": cleaned_category_path[:-1],
-            "heading_level": heading_level,
-            "heading_text": heading_text,
-            "text": text_content
-        }
-        return section_data
+        # 指定されたタグと無視するクラスを持つ要素を、一度の走査でまとめて削除
+        for tag in soup.select(_REMOVAL_SELECTOR):
+            if not tag.decomposed:  # 削除済みの要素の子孫はスキップ
+                tag.decompose()
 
-    def _clean_text(self, text: str) -> str:
-        """
-        テキストを正規化し不要な記号・文字列を削除する。
+        # コメントを削除
+        for comment in soup.find_all(string=lambda text: isinstance(text, Comment)):
+            comment.extract()
 
-        Args:
-            text (str): 正規化対象のテキスト。
 
-        Returns:
-            str: 正規化されたテキスト。
+    def _extract_headings_and_body(self, soup: BeautifulSoup) -> List[Dict[str, Any]]:
         """
-        text = self._normalize_text(text)
-        text = self._remove_unnecessary_chars(text)
-        text = self._normalize_spacing(text)
-        text = FullWidthConverter.convert_to_fullwidth(text)  # 全角に統一
-        return text
-
-    def _process_sibling_element_with_category(self, sibling: Tag, sibling_processors: Dict[str, Any],
-                                                category_path: List[str]) -> Optional[Dict[str, Any]]:
-        for check_func_name, process_func in sibling_processors.items():
-            if getattr(self, check_func_name)(sibling):
-                return process_func(sibling, category_path)
-        return None
+        BeautifulSoup オブジェクトから階層的な見出し (h2, h3, h4) と本文を抽出する。
+        テキスト分析しやすいフラットなリスト構造で出力する。
 
-    def _is_paragraph_element(self, sibling: Tag) -> bool:
-        return sibling.name in ['p', 'ul', 'div', 'blockquote', 'table', 'dl', 'ol'] or (
-                sibling.name == 'div' and 'mw-parser-output' in sibling.get('class', []))
+        本文領域 (mw-parser-output) の子要素を一度だけ走査する。
+        """
+        root = soup.find("div", class_="mw-parser-output") or soup
+        return self._build_sections(self._iter_html_blocks(root))
 
-    def _extract_paragraph_text(self, sibling: Tag) -> str:
-        return sibling.get_text(separator=" ", strip=True)
+    def _iter_html_blocks(self, root: Tag) -> Iterator[Tuple[Optional[int], str]]:
+        """
+        本文領域の子要素を走査し、(見出しレベル, テキスト) を順に返す。本文の場合、見出しレベルは None。
+        最初の見出しより前の要素 (導入部) と図 (figure) は返さない。
+        """
+        in_section = False
+        for element in root.find_all(True, recursive=False):
+            heading_level = self._heading_level(element)
+            if heading_level:
+                in_section = True
+                yield heading_level, self._extract_heading_text(element, f"h{heading_level}")
+            elif in_section and element.name != "figure":  # 図 (figure) は本文に含めない
+                yield None, self._extract_paragraph_text(element)
 
-    def _is_next_heading_level(self, sibling: Tag, next_heading_levels: List[str],
-                                current_heading_level_class: Optional[str]) -> bool:
-        sibling_heading_level_class = self.get_heading_level_class(sibling)
-        if sibling_heading_level_class is None:
-            return False
-        if current_heading_level_class is None:
-            return False
+    @staticmethod
+    def _iter_plaintext_blocks(extract: str) -> Iterator[Tuple[Optional[int], str]]:
+        """
+        プレーンテキスト抽出 (exsectionformat=wiki) の各行から、(見出しレベル, テキスト) を順に返す。
+        本文の場合、見出しレベルは None。h5 以下の見出しは HTML の場合と同様に本文として扱う。
+        最初の見出しより前の行 (導入部) は返さない。
+        """
+        in_section = False
+        for line in extract.splitlines():
+            match = _PLAINTEXT_HEADING_RE.match(line.strip())
+            if match:
+                heading_level = len(match.group(1))
+                if heading_level <= 4:
+                    in_section = True
+                    yield heading_level, match.group(2)
+                elif in_section:
+                    yield None, match.group(2)
+            elif in_section:
+                yield None, line.strip()
 
-        current_level_index = Config.HEADING_LEVELS.index(current_heading_level_class)
-        sibling_level_index = Config.HEADING_LEVELS.index(sibling_heading_level_class)
+    def _build_sections(self, blocks: Iterable[Tuple[Optional[int], str]]) -> List[Dict[str, Any]]:
+        """
+        (見出しレベル, テキスト) の並びから、階層的な見出しと本文のフラットなリストを組み立てる。
 
-        return sibling_level_index <= current_level_index
+        開いている見出しをスタックで管理し、本文はスタック上のすべての見出しに追加する。
+        そのため、上位の見出しのテキストには配下の見出しの本文も含まれる。
+        """
+        sections: List[Dict[str, Any]] = []
+        section_text_lists: List[List[str]] = []
+        # (見出しレベル, 自身を含むカテゴリパス, 本文リスト) のスタック
+        open_sections: List[Tuple[int, List[str], List[str]]] = []
+
+        for heading_level, text in blocks:
+            if heading_level:
+                while open_sections and open_sections[-1][0] >= heading_level:
+                    open_sections.pop()
+                category_path = open_sections[-1][1] if open_sections else []
+                text_list: List[str] = []
+                sections.append({
+                    "category_texts": list(category_path),
+                    "heading_level": heading_level,
+                    "heading_text": text,
+                    "text": "",
+                })
+                section_text_lists.append(text_list)
+                open_sections.append((heading_level, category_path + [self._clean_text(text)], text_list))
+            elif text and open_sections:
+                for _, _, text_list in open_sections:
+                    text_list.append(text)
+
+        for section, text_list in zip(sections, section_text_lists):
+            section["text"] = "\n".join(text_list).strip()
 
-    def get_heading_level_class(self, heading_div: Tag) -> Optional[str]:
-        for level_class in Config.HEADING_LEVELS:
-            if level_class in heading_div.get('class', []):
-                return level_class
-        return None
+        return sections
 
-    def _process_h3_section_with_category(self, sibling: BeautifulSoup, category_path: List[str]) -> Dict[str, Any]:
+    @staticmethod
+    def _heading_level(element: Tag) -> Optional[int]:
         """
-        h3 セクションの抽出処理を行う (カテゴリテキスト対応)。
+        要素が見出し (div.mw-heading) であれば、その見出しレベルを返す。
 
         Args:
-            sibling (BeautifulSoup): h3 セクションの div 要素。
-            category_path (List[str]): カテゴリパス。
+            element (Tag): 判定対象の要素。
 
         Returns:
-            Dict[str, Any]: 抽出された h3 セクションデータ。
-        """
-        return self._extract_section_content_with_category(sibling, category_path)
+            Optional[int]: 見出しレベル (2, 3, 4)。見出しでない場合は None。
+        """
+        if element.name != "div":
+            return None
+        classes = element.attrs.get("class")
+        if not classes or "mw-heading" not in classes:
+            return None
+        for class_name in classes:
+            heading_level = _HEADING_LEVEL_BY_CLASS.get(class_name)
+            if heading_level:
+                return heading_level
+        return None
 
-    def _process_h4_section_with_category(self, sibling: BeautifulSoup, category_path: List[str]) -> Dict[str, Any]:
+    def _clean_text(self, text: str) -> str:
         """
-        h4 セクションの抽出処理を行う (カテゴリテキスト対応)。
+        テキストを正規化し不要な記号・文字列を削除する。
 
         Args:
-            sibling (BeautifulSoup): h4 セクションの div 要素。
-            category_path (List[str]): カテゴリパス。
+            text (str): 正規化対象のテキスト。
 
         Returns:
-            Dict[str, Any]: 抽出された h4 セクションデータ。
+            str: 正規化されたテキスト。
         """
-        return self._extract_section_content_with_category(sibling, category_path)
+        return _clean_text_cached(text)
+
+    def _extract_paragraph_text(self, sibling: Tag) -> str:
+        # 空白のみの文字列を除いたテキスト片を、中間リストを作らずに連結する
+        return " ".join(sibling.stripped_strings)
 
     def _extract_heading_text(self, heading_div: BeautifulSoup, heading_level_tag: str) -> str:
         """
@@ -715,7 +952,11 @@ class Scraper:
         Returns:
             List[Dict[str, Any]]: 指定されたキーワードを含まないセクションデータのリスト。
         """
-        excluded_section_keywords = self.excluded_section_keywords
+        # インスタンスのキーワードが Config のものから変更されている場合は、そのキーワードでパターンを作成する
+        if self.excluded_section_keywords is Config.EXCLUDED_SECTION_KEYWORDS:
+            excluded_section_re = self._EXCLUDED_SECTION_RE
+        else:
+            excluded_section_re = _compile_keyword_pattern(self.excluded_section_keywords)
         processed_sections: List[Dict[str, Any]] = []
 
         for section in sections:
@@ -723,7 +964,7 @@ class Scraper:
                 section["heading_text"]]
             heading_text = heading_text_list[0] if heading_text_list else ""
 
-            if any(keyword in heading_text for keyword in excluded_section_keywords):
+            if excluded_section_re.search(heading_text):
                 continue
 
             processed_sections.append(section)
@@ -735,124 +976,36 @@ class Scraper:
     def _post_process_text_for_category(self, sections: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """
         抽出されたテキストに対して、正規化や不要な記号の削除などの後処理を行う (カテゴリテキスト対応)。
+        セクションデータは新たに作成せず、その場で書き換える。
 
         Args:
             sections (List[Dict[str, Any]]): 処理前のセクションデータのリスト。
 
         Returns:
-            List[Dict[str, Any]]: 後処理済みのセクションデータのリスト。
+            List[Dict[str, Any]]: 後処理済みのセクションデータのリスト (引数と同じリスト)。
         """
-        processed_sections: List[Dict[str, Any]] = []
         for section in sections:
-            processed_section = self._process_section_text_for_category(section)
-            processed_sections.append(processed_section)
-        return processed_sections
-
-    def _process_section_text_for_category(self, section: Dict[str, Any]) -> Dict[str, Any]:
-        """
-        セクションテキストの後処理 (正規化、不要記号削除、空白処理) を行う (カテゴリテキスト対応)。
-
-        Args:
-            section (Dict[str, Any]): 処理対象のセクションデータ。
-
-        Returns:
-            Dict[str, Any]: 後処理済みのセクションデータ。
-        """
-        heading_text: str = section["heading_text"]
-        text_content: str = section["text"]
-
-        heading_text = self._normalize_text(heading_text)
-        text_content = self._normalize_text(text_content)
-
-        heading_text = self._remove_unnecessary_chars(heading_text)
-        text_content = self._remove_unnecessary_chars(text_content)
-
-        heading_text = self._normalize_spacing(heading_text)
-        text_content = self._normalize_spacing(text_content)
-
-        heading_text = FullWidthConverter.convert_to_fullwidth(heading_text)  # 全角に統一
-        text_content = FullWidthConverter.convert_to_fullwidth(text_content)  # 全角に統一
-
-        return {
-            "category_texts": section["category_texts"],
-            "heading_level": section["heading_level"],
-            "heading_text": heading_text,
-            "text": text_content,
-        }
-
-    def _normalize_text(self, text: str) -> str:
-        """
-        テキストを正規化する (NFKC 形式)。
-
-        Args:
-            text (str): 正規化対象のテキスト。
-
-        Returns:
-            str: 正規化されたテキスト。
-        """
-        return unicodedata.normalize("NFKC", text)
-
-    def _remove_unnecessary_chars(self, text: str) -> str:
-        """
-        テキストから不要な記号・文字列 (セクション編集リンク、脚注・出典記号) を削除する。
-
-        Args:
-            text (str): 不要記号削除対象のテキスト。
-
-        Returns:
-            str: 不要記号が削除されたテキスト。
-        """
-        text = re.sub(r"\[編集\]", "", text)
-        text = re.sub(r"\[\d+\]|\[要出典\]", "", text)
-        pattern = r"[!\"#$%&'()*+,\-./:;<=>?@[\\\]^_`{|}~！”＃＄％＆’（）＊＋，－．／：；＜＝＞？＠「￥」＾＿‘｜’｛｝～©®…—–]"
-        text = re.sub(pattern, "", text)
-        return text
-
-    def _normalize_spacing(self, text: str) -> str:
-        text = re.sub(Config.FULL_WIDTH_SPACE, " ", text).strip()
-        text = re.sub(r'\s+', ' ', text)  # 連続する空白文字（タブ、改行含む）を一つの半角スペースに置換
-        return text
+            section["heading_text"] = self._clean_text(section["heading_text"])
+            section["text"] = _clean_text_uncached(section["text"])
+        return sections
 
-        # ----------------------- 不要ワードの削除 -----------------------
+    # ----------------------- 不要ワードの削除 -----------------------
 
     def _remove_exclude_words_for_category(self, sections: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """
         抽出されたテキストから不要な単語を削除する (カテゴリテキスト対応)。
+        セクションデータは新たに作成せず、その場で書き換える。
 
         Args:
             sections (List[Dict[str, Any]]): 処理前のセクションデータのリスト。
 
         Returns:
-            List[Dict[str, Any]]: 不要な単語が削除されたセクションデータのリスト。
+            List[Dict[str, Any]]: 不要な単語が削除されたセクションデータのリスト (引数と同じリスト)。
         """
-        processed_sections: List[Dict[str, Any]] = []
         for section in sections:
-            processed_section = self._process_exclude_words_in_section_for_category(section)
-            processed_sections.append(processed_section)
-        return processed_sections
-
-    def _process_exclude_words_in_section_for_category(self, section: Dict[str, Any]) -> Dict[str, Any]:
-        """
-        セクション内のテキストから不要な単語を削除する (カテゴリテキスト対応)。
-
-        Args:
-            section (Dict[str, Any]): 処理対象のセクションデータ。
-
-        Returns:
-            Dict[str, Any]: 不要な単語が削除されたセクションデータ。
-        """
-        heading_text: str = section["heading_text"]
-        text_content: str = section["text"]
-
-        heading_text = self._remove_words(heading_text, self.exclude_words)
-        text_content = self._remove_words(text_content, self.exclude_words)
-
-        return {
-            "category_texts": section["category_texts"],
-            "heading_level": section["heading_level"],
-            "heading_text": heading_text,
-            "text": text_content,
-        }
+            section["heading_text"] = self._remove_words(section["heading_text"], self.exclude_words)
+            section["text"] = self._remove_words(section["text"], self.exclude_words)
+        return sections
 
     def _remove_words(self, text: str, words_to_remove: List[str]) -> str:
         """
@@ -865,9 +1018,12 @@ class Scraper:
         Returns:
             str: 不要な単語が削除されたテキスト。
         """
-        combined_pattern = "|".join(re.escape(word) for word in words_to_remove)
-        text = re.sub(combined_pattern, "", text)
-        return text
+        # Config の除外ワードそのものであればクラスで作成済みのパターンを使い、それ以外は単語リストから作成する
+        if words_to_remove is Config.EXCLUDE_WORDS:
+            pattern = self._EXCLUDE_WORDS_RE
+        else:
+            pattern = _compile_keyword_pattern(words_to_remove)
+        return pattern.sub("", text)
 
     # ----------------------- JSON保存 -----------------------
 
@@ -889,6 +1045,9 @@ class Scraper:
 if __name__ == "__main__":
     from core.data_aggregator import DataAggregator
 
+    # ロギングの設定は実行時のみ行う (インポートしたモジュールの設定を上書きしないようにする)
+    configure_logging(level=Config.DEFAULT_LOG_LEVEL)
+
     page_titles = [
         "アルベルト・アインシュタイン",
         "マリ・キュリー",
@@ -897,29 +1056,30 @@ if __name__ == "__main__":
 
     DataAggregator.save_combined_data(page_titles)
 
-    for page_title in page_titles:
-        scraper = Scraper(page_title=page_title)
+    for page_title, fetch_result in Scraper.fetch_many(page_titles).items():
+        if fetch_result.is_err():
+            print(f"スクレイピング中にエラーが発生しました: {fetch_result.err_value}")
+            continue
 
+        scraper = fetch_result.ok_value
         try:
-            scraper.fetch_page_data()
-
             scraper.save_infobox_data()
             scraper.save_text_data()
 
             image_data = scraper.extract_image_data()
             print("Image Data:")
             print(f"取得した画像数: {len(image_data)}")
-            print(json.dumps(image_data, indent=2, ensure_ascii=False))
+            print_json(image_data)
             print("\n" + "=" * 50 + "\n")
 
             categories = scraper.extract_categories()
             print("Categories:")
-            print(json.dumps(categories, indent=2, ensure_ascii=False))
+            print_json(categories)
             print("\n" + "=" * 50 + "\n")
 
             additional_table_data = scraper.extract_additional_table_data()
             print("Additional Table Data:")
-            print(json.dumps(additional_table_data, indent=2, ensure_ascii=False))
+            print_json(additional_table_data)
             print("\n" + "=" * 50 + "\n")
 
         except ValueError as e:
@@ -1,42 +1,72 @@
 import pytest
 from core.data_normalizer import DataNormalizer
 
-class TestDataNormalizer:
+# 生誕情報から出身地を抽出できない場合の結果
+NO_BIRTH_PLACE = {"出身地_国": None, "出身地_州/王国": None, "出身地_都市": None}
 
-    @pytest.mark.parametrize("input_date, expected", [
-        ("令和3年5月1日", "2021-05-01"),
-        ("平成30年12月31日", "2018-12-31"),
-        ("2021/05/01", "2021-05-01"),
-        ("2021-05-01", "2021-05-01"),
-        ("不明", "不明"),
-        ("", "不明"),
-    ])
-    def test_normalize_date(self, input_date, expected):
-        assert DataNormalizer.normalize_date(input_date) == expected
+# (変換メソッド, 入力, 期待値) の一覧
+ALL_CASES = [
+    # normalize_date
+    (DataNormalizer.normalize_date, "令和3年5月1日", "2021-05-01"),
+    (DataNormalizer.normalize_date, "平成30年12月31日", "2018-12-31"),
+    (DataNormalizer.normalize_date, "令和元年5月1日", "2019-05-01"),
+    (DataNormalizer.normalize_date, "平成31年4月30日", "2019-04-30"),
+    (DataNormalizer.normalize_date, "昭和64年1月7日", "1989-01-07"),
+    (DataNormalizer.normalize_date, "平成元年1月8日", "1989-01-08"),
+    (DataNormalizer.normalize_date, "2021/05/01", "2021-05-01"),
+    (DataNormalizer.normalize_date, "2021-05-01", "2021-05-01"),
+    (DataNormalizer.normalize_date, "不明", "不明"),
+    (DataNormalizer.normalize_date, "", "不明"),
+    (DataNormalizer.normalize_date, None, "不明"),
+    (DataNormalizer.normalize_date, "2020年", "2020-01-01"),
+    (DataNormalizer.normalize_date, "2020年7月", "2020-07-01"),
+    (DataNormalizer.normalize_date, "2020年7月4日", "2020-07-04"),
+    (DataNormalizer.normalize_date, "2020/7/4", "2020-07-04"),
+    (DataNormalizer.normalize_date, "2020-7-4", "2020-07-04"),
+    (DataNormalizer.normalize_date, "2020年2月29日", "2020-02-29"),
+    (DataNormalizer.normalize_date, "2021年2月29日", "不明"),
+    (DataNormalizer.normalize_date, "2020年2月30日", "不明"),
+    (DataNormalizer.normalize_date, "2020/13/01", "不明"),
+    # standardize_location
+    (DataNormalizer.standardize_location, "東京", "東京都"),
+    (DataNormalizer.standardize_location, "大阪", "大阪府"),
+    (DataNormalizer.standardize_location, "不明な地名", "不明な地名"),
+    # standardize_field
+    (DataNormalizer.standardize_field, "物理学", "科学"),
+    (DataNormalizer.standardize_field, "文学", "人文科学"),
+    (DataNormalizer.standardize_field, "未知の分野", "未知の分野"),
+    # handle_missing_value
+    (DataNormalizer.handle_missing_value, "存在する値", "存在する値"),
+    (DataNormalizer.handle_missing_value, None, "不明"),
+    (DataNormalizer.handle_missing_value, "", "不明"),
+    # extract_country_from_birth_info (情報なし)
+    (DataNormalizer.extract_country_from_birth_info, None, NO_BIRTH_PLACE),
+    (DataNormalizer.extract_country_from_birth_info, "", NO_BIRTH_PLACE),
+    (DataNormalizer.extract_country_from_birth_info, "  ", NO_BIRTH_PLACE),
+    # normalize_nationality_info (情報なし)
+    (DataNormalizer.normalize_nationality_info, None, [{"国籍": []}]),
+    (DataNormalizer.normalize_nationality_info, "", [{"国籍": []}]),
+    (DataNormalizer.normalize_nationality_info, "  ", [{"国籍": []}]),
+    # normalize_children_info (情報なし)
+    (DataNormalizer.normalize_children_info, None, []),
+    (DataNormalizer.normalize_children_info, "", []),
+    (DataNormalizer.normalize_children_info, "  ", []),
+    # normalize_field_info (情報なし)
+    (DataNormalizer.normalize_field_info, None, []),
+    (DataNormalizer.normalize_field_info, "", []),
+    (DataNormalizer.normalize_field_info, "  ", []),
+    # normalize_achievements_info (情報なし)
+    (DataNormalizer.normalize_achievements_info, None, []),
+    (DataNormalizer.normalize_achievements_info, "", []),
+    (DataNormalizer.normalize_achievements_info, "  ", []),
+]
 
-    @pytest.mark.parametrize("input_location, expected", [
-        ("東京", "東京都"),
-        ("大阪", "大阪府"),
-        ("不明な地名", "不明な地名"),
-    ])
-    def test_standardize_location(self, input_location, expected):
-        assert DataNormalizer.standardize_location(input_location) == expected
 
-    @pytest.mark.parametrize("input_field, expected", [
-        ("物理学", "科学"),
-        ("文学", "人文科学"),
-        ("未知の分野", "未知の分野"),
-    ])
-    def test_standardize_field(self, input_field, expected):
-        assert DataNormalizer.standardize_field(input_field) == expected
+class TestDataNormalizer:
 
-    @pytest.mark.parametrize("input_value, expected", [
-        ("存在する値", "存在する値"),
-        (None, "不明"),
-        ("", "不明"),
-    ])
-    def test_handle_missing_value(self, input_value, expected):
-        assert DataNormalizer.handle_missing_value(input_value) == expected
+    @pytest.mark.parametrize("fn, input_value, expected", ALL_CASES)
+    def test_normalize(self, fn, input_value, expected):
+        assert fn(input_value) == expected
 
 if __name__ == '__main__':
-    pytest.main()
\ No newline at end of file
+    pytest.main()
@@ -0,0 +1,185 @@
+import os
+import re
+import threading
+import time
+import numpy as np
+import pandas as pd
+import pytest
+from loguru import logger
+from utils.logger import BoundedQueueSink, _format_dataframe
+
+
+def _wait_until(predicate, timeout=2.0):
+    """predicate が真になるまで (最大 timeout 秒) 待ち、最後の結果を返す。"""
+    deadline = time.monotonic() + timeout
+    while not predicate() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    return predicate()
+
+
+def _read_text(path):
+    with open(path, encoding="utf-8") as f:
+        return f.read()
+
+
+class TestFormatDataframe:
+
+    def test_truncates_long_strings_including_str_subclasses(self):
+        df = pd.DataFrame({"text": pd.Series([np.str_("x" * 25), "y" * 25, "short", 12345], dtype=object)})
+        table = _format_dataframe(df, max_col_width=20)
+        assert "x" * 20 + "..." in table
+        assert "x" * 21 not in table
+        assert "y" * 20 + "..." in table
+        assert "short" in table
+        assert "12345" in table
+
+    def test_does_not_truncate_numeric_columns(self):
+        df = pd.DataFrame({"value": [12345678901234567890.5]})
+        table = _format_dataframe(df, max_col_width=5)
+        assert "..." not in table
+
+
+class TestBoundedQueueSink:
+
+    @pytest.fixture
+    def add_sink(self, tmp_path):
+        """BoundedQueueSink を loguru に追加する関数を返し、テストの終了時に取り除く。"""
+        handler_ids = []
+
+        def add(maxsize=1000, **kwargs):
+            sink = BoundedQueueSink(str(tmp_path / "app.log"), maxsize, **kwargs)
+            handler_ids.append(logger.add(sink, format="{level}: {message}", level="DEBUG"))
+            return sink, handler_ids[-1]
+
+        yield add
+        for handler_id in handler_ids:
+            try:
+                logger.remove(handler_id)
+            except ValueError:
+                pass  # テスト内で取り除き済み
+
+    def test_rotation_limit_is_in_bytes(self, tmp_path):
+        sink = BoundedQueueSink(str(tmp_path / "app.log"), maxsize=1000, rotation=200)
+        records = [f"{i:03d} 日本語のログメッセージ\n" for i in range(30)]  # 1 件 38 バイト (16 文字)
+        for record in records:
+            sink.write(record)
+        sink.stop()
+
+        rotated = sorted(path for path in os.listdir(tmp_path) if path != "app.log")
+        paths = [tmp_path / path for path in rotated] + [tmp_path / "app.log"]
+        assert len(rotated) == 5  # 200 バイトに 5 件ずつ (文字数で数えると 12 件ずつになる)
+        assert all(os.path.getsize(path) <= 200 for path in paths)
+        assert "".join(_read_text(path) for path in paths) == "".join(records)
+
+    def test_flushes_on_warning(self, tmp_path, add_sink):
+        add_sink(buffer_size=1024 * 1024, flush_interval=60)
+        log_path = tmp_path / "app.log"
+
+        logger.info("バッファに残る")
+        time.sleep(0.2)
+        assert not log_path.exists() or _read_text(log_path) == ""
+
+        logger.warning("すぐに書き出す")
+        assert _wait_until(lambda: _read_text(log_path) == "INFO: バッファに残る\nWARNING: すぐに書き出す\n")
+
+    def test_flushes_when_idle(self, tmp_path, add_sink):
+        add_sink(buffer_size=1024 * 1024, flush_interval=0.1)
+        log_path = tmp_path / "app.log"
+
+        logger.info("次のレコードがなくても書き出す")
+        assert _wait_until(lambda: log_path.exists() and _read_text(log_path) == "INFO: 次のレコードがなくても書き出す\n")
+
+    def test_drains_queue_on_stop(self, tmp_path, add_sink):
+        sink, handler_id = add_sink(10000, buffer_size=1024 * 1024, flush_interval=60)
+
+        for i in range(1000):
+            logger.debug("レコード {}", i)
+        logger.remove(handler_id)  # シンクの stop() が呼ばれる
+
+        assert not sink._thread.is_alive()
+        assert sink.dropped == 0
+        assert _read_text(tmp_path / "app.log") == "".join(f"DEBUG: レコード {i}\n" for i in range(1000))
+
+
+class BlockingSink(BoundedQueueSink):
+    """release が設定されるまで、書き込みスレッドを最初の書き込みで止めておくシンク。"""
+
+    def __init__(self, *args, **kwargs):
+        self.entered = threading.Event()
+        self.release = threading.Event()
+        super().__init__(*args, **kwargs)
+
+    def _write_batch(self, batch):
+        self.entered.set()
+        assert self.release.wait(timeout=5)
+        super()._write_batch(batch)
+
+
+class TestDrain:
+
+    def test_reports_dropped_records(self, tmp_path):
+        sink = BlockingSink(str(tmp_path / "app.log"), maxsize=2, batch_size=10)
+        sink.write("a\n")
+        assert sink.entered.wait(timeout=2)  # "a" を取り出した書き込みスレッドが止まっている
+
+        for message in ["b\n", "c\n", "d\n", "e\n", "f\n"]:
+            sink.write(message)
+        assert sink.dropped == 3  # キューに入る 2 件 (b, c) を超えた分
+
+        sink.release.set()
+        sink.stop()
+        assert _read_text(tmp_path / "app.log") == "a\n(ログキューが満杯のため 3 件のログを破棄しました)\nb\nc\n"
+
+    def test_stop_sentinel_in_the_middle_of_a_batch(self, tmp_path):
+        sink = BlockingSink(str(tmp_path / "app.log"), maxsize=10, batch_size=10)
+        sink.write("a\n")
+        assert sink.entered.wait(timeout=2)
+
+        sink.write("b\n")
+        sink.write("c\n")
+        stopper = threading.Thread(target=sink.stop)
+        stopper.start()
+        assert _wait_until(lambda: sink._queue.qsize() == 3)  # b, c, 停止の合図
+        sink._queue.put_nowait("停止後\n")  # 停止の合図と同じバッチに入るが、書き込まれない
+
+        sink.release.set()
+        stopper.join(timeout=5)
+        assert not sink._thread.is_alive()
+        assert _read_text(tmp_path / "app.log") == "a\nb\nc\n"
+
+    def test_concurrent_writers_keep_order_and_count_drops(self, tmp_path):
+        sink = BoundedQueueSink(str(tmp_path / "app.log"), maxsize=8, batch_size=4)
+        writers = 4
+        per_writer = 2000
+
+        def write_records(writer):
+            for i in range(per_writer):
+                sink.write(f"{writer} {i}\n")
+
+        threads = [threading.Thread(target=write_records, args=(writer,)) for writer in range(writers)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        sink.stop()
+
+        lines = _read_text(tmp_path / "app.log").splitlines()
+        reported = sum(int(re.search(r"(\d+) 件", line).group(1)) for line in lines if "破棄しました" in line)
+        records = [tuple(map(int, line.split())) for line in lines if "破棄しました" not in line]
+        assert reported == sink.dropped
+        assert len(records) + sink.dropped == writers * per_writer
+        for writer in range(writers):
+            indexes = [i for w, i in records if w == writer]
+            assert indexes == sorted(indexes)  # 書き込み順は保たれる
+
+    def test_writes_all_records_queued_before_stop_in_order(self, tmp_path):
+        sink = BlockingSink(str(tmp_path / "app.log"), maxsize=100, batch_size=7)
+        sink.write("0\n")
+        assert sink.entered.wait(timeout=2)
+        for i in range(1, 100):
+            sink.write(f"{i}\n")
+
+        sink.release.set()
+        sink.stop()
+        assert sink.dropped == 0
+        assert _read_text(tmp_path / "app.log") == "".join(f"{i}\n" for i in range(100))
@@ -0,0 +1,237 @@
+import json
+import threading
+import pytest
+import requests
+from core.scraper import Scraper
+
+# 解析結果を確認するための固定の HTML (Infobox、画像、見出し、脚注、削除対象の要素を含む)
+PAGE_HTML = """
+<div class="mw-parser-output">
+  <table class="infobox">
+    <tr><th colspan="2">アルベルト・アインシュタイン</th></tr>
+    <tr><td colspan="2"><img src="//upload.example/einstein.jpg" alt="肖像"></td></tr>
+    <tr><th>生誕</th><td>1879年3月14日<sup>[1]</sup> ドイツ帝国 ウルム</td></tr>
+    <tr><th>国籍</th><td><strong>ドイツ</strong> スイス(英語版)</td></tr>
+  </table>
+  <p>導入部の本文。</p>
+  <div class="mw-heading mw-heading2"><h2>生涯</h2><span>[編集]</span></div>
+  <p>幼少期の本文<sup>[2]</sup>。</p>
+  <figure><img src="//upload.example/childhood.jpg" alt="幼少期"></figure>
+  <div class="mw-heading mw-heading3"><h3>生い立ち</h3></div>
+  <p>父はヘルマン・アインシュタイン、母はパウリーネ・コッホ。</p>
+  <!-- コメント -->
+  <table class="toccolours"><tr><td>削除される表</td></tr></table>
+  <div class="mw-heading mw-heading2"><h2>業績</h2></div>
+  <p>相対性理論。</p>
+</div>
+"""
+
+
+class StubResponse:
+    """Wikipedia API のレスポンスの代わりに使用する、JSON を返すだけのレスポンス。"""
+
+    def __init__(self, payload):
+        self.content = json.dumps(payload).encode("utf-8")
+        self.status_code = 200
+        self.headers = {}
+        self.from_cache = False
+
+    def raise_for_status(self):
+        pass
+
+
+class StubSession:
+    """ページタイトルまたは action ごとに、あらかじめ用意したレスポンスを返すセッション。"""
+
+    def __init__(self, payloads):
+        self.payloads = payloads
+        self.requested_titles = []
+        self._lock = threading.Lock()
+
+    def get(self, url, params=None, headers=None, timeout=None):
+        title = params.get("page") or params.get("titles")
+        with self._lock:
+            self.requested_titles.append(title)
+        payload = self.payloads[(params["action"], title)]
+        if isinstance(payload, Exception):
+            raise payload
+        return StubResponse(payload)
+
+
+@pytest.fixture
+def scraper(monkeypatch):
+    # HTTP セッション (requests_cache) を作成しないよう、共有セッションを差し替える
+    monkeypatch.setattr(Scraper, "_shared_session", object())
+    scraper = Scraper("アルベルト・アインシュタイン")
+    scraper.page_content = PAGE_HTML
+    return scraper
+
+
+def _new_scraper():
+    scraper = Scraper("アルベルト・アインシュタイン")
+    scraper.page_content = PAGE_HTML
+    return scraper
+
+
+class TestParseAll:
+
+    def test_parse_all_extracts_images_infobox_and_text(self, scraper):
+        result = scraper.parse_all()
+
+        assert result["images"] == [
+            {"image_url": "//upload.example/einstein.jpg", "alt_text": "肖像"},
+            {"image_url": "//upload.example/childhood.jpg", "alt_text": "幼少期"},
+        ]
+        assert result["infobox"] == {
+            "名前": "アルベルト・アインシュタイン",
+            "生誕": "1879年3月14日 ドイツ帝国 ウルム",
+            "国籍": "スイス",
+        }
+        sections = result["text"]["sections"]
+        assert [(section["category_texts"], section["heading_text"]) for section in sections] == [
+            ([], "生涯"),
+            (["生涯"], "生い立ち"),
+            ([], "業績"),
+        ]
+        assert sections[1]["text"] == "父はヘルマン・アインシュタイン、母はパウリーネ・コッホ。"
+        assert "削除される表" not in sections[0]["text"]
+
+    def test_results_do_not_depend_on_extraction_order(self, scraper):
+        expected = scraper.parse_all()
+
+        # 解析結果を書き換える本文の抽出を先に行っても、画像と Infobox は同じになる
+        text_first = _new_scraper()
+        text = text_first.extract_text()
+        assert text_first.extract_image_data() == expected["images"]
+        assert text_first.extract_infobox_data() == expected["infobox"]
+        assert text == expected["text"]
+
+        # 本文を抽出する前に、画像と Infobox をそれぞれ個別に解析した場合も同じになる
+        separate = _new_scraper()
+        assert separate.extract_infobox_data() == expected["infobox"]
+        assert separate.extract_image_data() == expected["images"]
+        assert separate.extract_text() == expected["text"]
+
+    def test_parse_all_without_page_content_raises(self, scraper):
+        scraper.page_content = None
+        with pytest.raises(ValueError):
+            scraper.parse_all()
+
+
+class TestFetchMany:
+
+    def test_mixed_results_keep_input_order(self, monkeypatch):
+        session = StubSession({
+            ("parse", "成功"): {"parse": {"pageid": 1, "text": {"*": PAGE_HTML}, "categories": []}},
+            ("parse", "API エラー"): {"error": {"info": "missingtitle"}},
+            ("parse", "通信エラー"): requests.exceptions.ConnectionError("接続できません"),
+            ("parse", "不正なレスポンス"): {"parse": {"pageid": 2}},  # "text" がなく KeyError になる
+            ("parse", "成功2"): {"parse": {"pageid": 3, "text": {"*": "<p>本文</p>"}, "categories": []}},
+        })
+        monkeypatch.setattr(Scraper, "_shared_session", session)
+        titles = ["成功", "API エラー", "通信エラー", "不正なレスポンス", "成功2"]
+
+        results = Scraper.fetch_many(titles, max_workers=3)
+
+        assert list(results) == titles
+        assert results["成功"].is_ok()
+        assert results["成功"].ok_value.page_id == 1
+        assert results["成功"].ok_value.page_content == PAGE_HTML
+        assert results["API エラー"].err_value == "Wikipedia API エラー: missingtitle"
+        assert results["通信エラー"].err_value.startswith("リクエストエラー:")
+        assert results["不正なレスポンス"].is_err()
+        assert "KeyError" in results["不正なレスポンス"].err_value
+        assert results["成功2"].ok_value.page_id == 3
+        assert sorted(session.requested_titles) == sorted(titles)
+
+
+class TestExtractCategories:
+
+    # parse レスポンスのカテゴリ (名前空間なし、空白はアンダースコア)
+    PARSE_CATEGORIES = [
+        {"sortkey": "", "*": "ドイツの物理学者"},
+        {"sortkey": "", "*": "Albert_Einstein"},
+        {"sortkey": "", "hidden": "", "*": "出典を必要とする記事/2020年"},
+        {"sortkey": "", "hidden": "", "*": "テキストの検証が必要な項目"},
+    ]
+    # 同じカテゴリの query レスポンス (名前空間付き、空白はそのまま)
+    QUERY_CATEGORIES = [
+        {"ns": 14, "title": "Category:ドイツの物理学者"},
+        {"ns": 14, "title": "Category:Albert Einstein"},
+        {"ns": 14, "title": "Category:出典を必要とする記事/2020年"},
+        {"ns": 14, "title": "Category:テキストの検証が必要な項目"},
+    ]
+    EXPECTED = ["Category:ドイツの物理学者", "Category:Albert Einstein"]
+
+    def test_parse_payload_matches_query_fallback(self, monkeypatch):
+        session = StubSession({
+            ("query", "アルベルト・アインシュタイン"): {"query": {"pages": {"1": {"categories": self.QUERY_CATEGORIES}}}},
+        })
+        monkeypatch.setattr(Scraper, "_shared_session", session)
+
+        from_parse = Scraper("アルベルト・アインシュタイン")
+        from_parse._parse_payload = {"categories": self.PARSE_CATEGORIES}
+        from_query = Scraper("アルベルト・アインシュタイン")
+
+        assert from_parse.extract_categories() == self.EXPECTED
+        assert session.requested_titles == []  # parse レスポンスのカテゴリを使い、API には問い合わせない
+        assert from_query.extract_categories() == self.EXPECTED
+        assert session.requested_titles == ["アルベルト・アインシュタイン"]
+
+
+class TestExtractTextFast:
+
+    # exsectionformat=wiki のプレーンテキスト抽出 (h5 の見出しは本文として扱う)
+    EXTRACT = (
+        "導入部。\n\n"
+        "== 生涯 ==\n幼少期の本文。\n\n"
+        "=== 生い立ち ===\n父はヘルマン。\n"
+        "===== 細目 =====\n細目の本文。\n\n"
+        "== 業績 ==\n相対性理論。"
+    )
+
+    def test_plaintext_blocks_build_sections(self, scraper):
+        blocks = list(Scraper._iter_plaintext_blocks(self.EXTRACT))
+        assert blocks == [
+            (2, "生涯"), (None, "幼少期の本文。"), (None, ""),
+            (3, "生い立ち"), (None, "父はヘルマン。"), (None, "細目"), (None, "細目の本文。"), (None, ""),
+            (2, "業績"), (None, "相対性理論。"),
+        ]
+
+        sections = scraper._build_sections(blocks)
+        assert sections == [
+            {"category_texts": [], "heading_level": 2, "heading_text": "生涯",
+             "text": "幼少期の本文。\n父はヘルマン。\n細目\n細目の本文。"},
+            {"category_texts": ["生涯"], "heading_level": 3, "heading_text": "生い立ち",
+             "text": "父はヘルマン。\n細目\n細目の本文。"},
+            {"category_texts": [], "heading_level": 2, "heading_text": "業績", "text": "相対性理論。"},
+        ]
+
+    @staticmethod
+    def _set_session(scraper, payload):
+        session = StubSession({("query", "アルベルト・アインシュタイン"): payload})
+        scraper.session = session
+        return session
+
+    def test_result_is_cached(self, scraper):
+        session = self._set_session(scraper, {
+            "query": {"pages": {"1": {"extract": self.EXTRACT, "length": len(self.EXTRACT.encode("utf-8"))}}},
+        })
+
+        first = scraper.extract_text_fast()
+        assert [section["heading_text"] for section in first["sections"]] == ["生涯", "生い立ち", "業績"]
+        assert scraper.extract_text_fast() is first
+        assert session.requested_titles == ["アルベルト・アインシュタイン"]
+
+    @pytest.mark.parametrize("payload", [
+        {"query": {"pages": {"1": {"length": 1000}}}},  # プレーンテキストなし
+        {"continue": {"excontinue": 1}, "query": {"pages": {"1": {"extract": EXTRACT, "length": 1000}}}},  # 続きがある
+        {"query": {"pages": {"1": {"extract": EXTRACT, "length": 100000}}}},  # ページに対して極端に短い
+    ])
+    def test_falls_back_to_html_when_missing_or_truncated(self, scraper, payload):
+        session = self._set_session(scraper, payload)
+
+        result = scraper.extract_text_fast()
+        assert result == _new_scraper().extract_text()
+        assert scraper.extract_text_fast() is result
+        assert session.requested_titles == ["アルベルト・アインシュタイン"]
@@ -1,15 +1,171 @@
 import sys
 import os
+import functools
+import queue
+import threading
+import time
+import glob
+import zipfile
+from datetime import datetime
 from loguru import logger
 from config import Config
+import numpy as np
 import pandas as pd
-from tabulate import tabulate
 
 def create_directory_if_not_exists(directory):
     """指定されたディレクトリが存在しない場合に作成する関数。"""
-    if not os.path.exists(directory):
-        os.makedirs(directory)
-        print(f"ディレクトリ '{directory}' を作成しました。")
+    # 存在確認と作成を 1 回の呼び出しで行う (他プロセスとの作成の競合も起きない)
+    os.makedirs(directory, exist_ok=True)
+
+
+# このレベル以上のレコードを書き込んだ場合は、ファイルの書き込みバッファをすぐにフラッシュする
+_FLUSH_LEVEL_NO = logger.level("WARNING").no
+# ローテーションしたファイル名に付ける日時 (loguru のファイルシンクと同じ形式)
+_ROTATION_TIME_FORMAT = "%Y-%m-%d_%H-%M-%S_%f"
+
+
+class BoundedQueueSink:
+    """
+    上限付きキューを介してログファイルへ書き出す loguru シンク。
+    キューが満杯の場合はレコードを破棄するため、ディスク書き込みが追いつかなくてもメモリ使用量が増え続けない。
+    バックグラウンドスレッドがキューに溜まったレコードをまとめて取り出し、自身で開いたファイルへバッファ付きで書き込む。
+    ファイルの書き込み、フラッシュ、ローテーションはすべてこのスレッドで行う。
+    バッファは WARNING 以上のレコードを書き込んだ時、flush_interval 秒ごと (キューが空の間も含む)、ローテーション時と停止時にフラッシュする。
+    """
+
+    def __init__(self, path, maxsize, batch_size=None, buffer_size=None, rotation=None, retention=None,
+                 compression=None, flush_interval=None):
+        """
+        Args:
+            path (str): ログファイルのパス。
+            maxsize (int): キューに保持する最大レコード数。
+            batch_size (int, optional): 1 回の書き込みにまとめる最大レコード数. Defaults to None (Config.LOG_DRAIN_BATCH_SIZE を使用).
+            buffer_size (int, optional): ファイルの書き込みバッファ (バイト数、1 以下でバッファなし). Defaults to None (Config.LOG_FILE_BUFFER_SIZE を使用).
+            rotation (int, optional): ローテーションするファイルサイズ (バイト数). Defaults to None (ローテーションしない).
+            retention (int, optional): 保持するローテーション済みファイルの数. Defaults to None (すべて保持).
+            compression (str, optional): ローテーション済みファイルの圧縮形式 ("zip" のみ対応). Defaults to None (圧縮しない).
+            flush_interval (float, optional): バッファをフラッシュする間隔 (秒). Defaults to None (Config.LOG_FLUSH_INTERVAL を使用).
+
+        Raises:
+            ValueError: 対応していない圧縮形式が指定された場合。
+        """
+        if compression not in (None, "zip"):
+            raise ValueError(f"対応していない圧縮形式です: {compression}")
+        self._path = path
+        self._queue = queue.Queue(maxsize=maxsize)
+        self._batch_size = batch_size if batch_size is not None else Config.LOG_DRAIN_BATCH_SIZE
+        self._buffer_size = buffer_size if buffer_size is not None else Config.LOG_FILE_BUFFER_SIZE
+        self._rotation = rotation
+        self._retention = retention
+        self._compression = compression
+        self._flush_interval = flush_interval if flush_interval is not None else Config.LOG_FLUSH_INTERVAL
+        self._file = None
+        self._size = 0
+        self.dropped = 0
+        self._dropped_lock = threading.Lock()  # 破棄件数はログを出力する複数のスレッドから更新される
+        self._thread = threading.Thread(target=self._drain, name="log-drain", daemon=True)
+        self._thread.start()
+
+    def write(self, message):
+        """整形済みのレコードをキューに追加する。キューが満杯の場合は破棄する。"""
+        try:
+            self._queue.put_nowait(message)  # レベルを参照できるよう、record を持つ loguru のメッセージのまま追加する
+        except queue.Full:
+            with self._dropped_lock:
+                self.dropped += 1
+
+    def stop(self):
+        """キューに残ったレコードを書き出し、ファイルを閉じてからスレッドを終了する。"""
+        self._queue.put(None)
+        self._thread.join()
+
+    def _drain(self):
+        reported = 0
+        stopped = False
+        unflushed = False
+        last_flush = time.monotonic()
+        try:
+            while not stopped:
+                # 最初の 1 件を待ち、続けて取り出せる分をまとめて 1 回で書き込む。
+                # フラッシュしていない書き込みがある場合は、待つ時間をフラッシュ間隔までにする
+                try:
+                    batch = [self._queue.get(timeout=self._flush_interval if unflushed else None)]
+                except queue.Empty:
+                    self._file.flush()
+                    unflushed = False
+                    last_flush = time.monotonic()
+                    continue
+                while len(batch) < self._batch_size:
+                    try:
+                        batch.append(self._queue.get_nowait())
+                    except queue.Empty:
+                        break
+                if None in batch:
+                    stopped = True
+                    batch = batch[:batch.index(None)]
+                with self._dropped_lock:
+                    dropped = self.dropped
+                if dropped != reported:
+                    batch.insert(0, f"(ログキューが満杯のため {dropped - reported} 件のログを破棄しました)\n")
+                    reported = dropped
+                if batch:
+                    self._write_batch(batch)
+                    unflushed = True
+                if unflushed and (
+                    any(getattr(message, "record", None) and message.record["level"].no >= _FLUSH_LEVEL_NO for message in batch)
+                    or time.monotonic() - last_flush >= self._flush_interval
+                ):
+                    self._file.flush()
+                    unflushed = False
+                    last_flush = time.monotonic()
+        finally:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    def _write_batch(self, batch):
+        """
+        レコードをまとめてファイルに書き込む。
+        書き込むとファイルサイズの上限を超えるレコードがある場合は、その手前までを書き込んでからローテーションする。
+        """
+        if self._file is None:
+            self._open()
+        chunk = []
+        for message in batch:
+            data = message.encode("utf-8")
+            if self._rotation is not None and self._size > 0 and self._size + len(data) > self._rotation:
+                self._file.write(b"".join(chunk))
+                chunk = []
+                self._rotate()
+            chunk.append(data)
+            self._size += len(data)
+        self._file.write(b"".join(chunk))
+
+    def _open(self):
+        """ログファイルを追記モードで開き、既存の内容のサイズから数え始める。"""
+        self._file = open(self._path, "ab", buffering=self._buffer_size if self._buffer_size > 1 else 0)
+        self._size = self._file.tell()
+
+    def _rotate(self):
+        """現在のファイルを日時付きの名前に変更し (必要に応じて圧縮し)、新しいファイルを開く。"""
+        self._file.close()
+        root, ext = os.path.splitext(self._path)
+        rotated_path = f"{root}.{datetime.now().strftime(_ROTATION_TIME_FORMAT)}{ext}"
+        os.replace(self._path, rotated_path)
+        if self._compression == "zip":
+            with zipfile.ZipFile(f"{rotated_path}.zip", "w", zipfile.ZIP_DEFLATED) as archive:
+                archive.write(rotated_path, os.path.basename(rotated_path))
+            os.remove(rotated_path)
+        if self._retention is not None:
+            # ファイル名の日時の順に並べ、新しいものから retention 件を残す
+            rotated_files = sorted(glob.glob(f"{glob.escape(root)}.*{glob.escape(ext)}*"))
+            for old_path in rotated_files[:max(len(rotated_files) - self._retention, 0)]:
+                os.remove(old_path)
+        self._open()
+
+
+# 最後に configure_logging で適用した設定 (同じ設定での再設定を省くために使用)
+_current_settings = None
 
 
 def configure_logging(
@@ -21,38 +177,103 @@ def configure_logging(
         log_directory=None,
         log_file_format=None,
         console_log_format=None,
+        queue_maxsize=None,
+        buffer_size=None,
+        force=False,
 ):
     """
     loguru を設定する関数。
     コンソール出力とファイル出力を設定し、ログフォーマットとログレベルを定義。
     ファイルローテーション設定 (サイズ上限) を追加。
+    サイズによるローテーションでは上限付きキューのシンク (BoundedQueueSink) がログファイルに直接書き込み、
+    buffer_size (既定は Config.LOG_FILE_BUFFER_SIZE) のバッファでまとめた書き込みを、WARNING 以上のレコードの書き込み時、
+    Config.LOG_FLUSH_INTERVAL 秒ごと、ローテーション時と設定解除時 (終了時を含む) にフラッシュする。
+    変数値付きのトレースバック (diagnose) は Config.DIAGNOSE_LOG_LEVEL 以上のレコードのみ diagnose.log に出力する。
 
     Args:
         level (str, optional): ロギングレベル (例: "DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"). Defaults to None (Config.DEFAULT_LOG_LEVEL を使用).
         stream (io.TextIOBase, optional): コンソールログ出力先ストリーム (例: sys.stdout, sys.stderr). Defaults to sys.stdout.
-        rotation (str, optional): ログローテーション設定 (例: "10 MB", "1 day"). Defaults to None (Config.LOG_ROTATION を使用).
+        rotation (int or str, optional): ログローテーション設定 (ファイルサイズのバイト数、または "1 day" などの loguru の設定). Defaults to None (Config.LOG_ROTATION を使用).
         retention (int, optional): 保持するログファイル数. Defaults to None (Config.LOG_RETENTION を使用).
         compression (str, optional): ローテーション時のファイル圧縮形式. Defaults to None (Config.LOG_COMPRESSION を使用).
         log_directory (str, optional): ログファイル出力先ディレクトリ. Defaults to None (Config.LOG_DIRECTORY を使用).
         log_file_format (str, optional): ログファイルフォーマット. Defaults to None (Config.LOG_FILE_FORMAT を使用).
         console_log_format (str, optional): コンソールログフォーマット. Defaults to None (Config.CONSOLE_LOG_FORMAT を使用).
+        queue_maxsize (int, optional): ファイル出力キューの最大レコード数。0 の場合 (とサイズ以外のローテーション設定の場合) は loguru の上限なしキューを使用. Defaults to None (Config.LOG_QUEUE_MAXSIZE を使用).
+        buffer_size (int, optional): ログファイルの書き込みバッファ (バイト数、1 以下でバッファなし). Defaults to None (Config.LOG_FILE_BUFFER_SIZE を使用).
+        force (bool, optional): 設定が前回と同じ場合も、シンクを作り直す. Defaults to False.
     """
-    logger.configure(handlers=[])
+    global _current_settings
 
     log_level = level if level is not None else Config.DEFAULT_LOG_LEVEL
     log_dir = log_directory if log_directory is not None else Config.LOG_DIRECTORY
     file_log_format = log_file_format if log_file_format is not None else Config.LOG_FILE_FORMAT
     console_format = console_log_format if console_log_format is not None else Config.CONSOLE_LOG_FORMAT
+    log_buffering = buffer_size if buffer_size is not None else Config.LOG_FILE_BUFFER_SIZE
     log_rotation = rotation if rotation is not None else Config.LOG_ROTATION
     log_retention = retention if retention is not None else Config.LOG_RETENTION
     log_compression = compression if compression is not None else Config.LOG_COMPRESSION
+    log_queue_maxsize = queue_maxsize if queue_maxsize is not None else Config.LOG_QUEUE_MAXSIZE
+    diagnose_level = Config.DIAGNOSE_LOG_LEVEL
+
+    # 前回と同じ設定で呼ばれた場合は、シンク (とキューのスレッド) を作り直さない
+    settings = (
+        log_level, stream, log_dir, file_log_format, console_format, log_buffering,
+        log_rotation, log_retention, log_compression, log_queue_maxsize, diagnose_level,
+    )
+    if not force and settings == _current_settings:
+        return
+    _current_settings = settings
+
+    logger.configure(handlers=[])
 
     create_directory_if_not_exists(log_dir)
 
     log_file_path = os.path.join(log_dir, "app.log")
+    # サイズ (バイト数) によるローテーション、件数による保持、zip 圧縮であれば、上限付きキューのシンクが自身でファイルに書き出す。
+    # 時刻や間隔によるローテーションなどの設定では loguru のファイルシンクを使用する
+    use_queue_sink = (
+        log_queue_maxsize > 0
+        and isinstance(log_rotation, int)
+        and isinstance(log_retention, int)
+        and log_compression in (None, "zip")
+    )
+    if use_queue_sink:
+        logger.add(
+            BoundedQueueSink(
+                log_file_path,
+                log_queue_maxsize,
+                buffer_size=log_buffering,
+                rotation=log_rotation,
+                retention=log_retention,
+                compression=log_compression,
+            ),
+            level=log_level,
+            format=file_log_format,
+            colorize=False,
+            backtrace=False,
+            diagnose=False,
+        )
+    else:
+        # loguru の enqueue では書き込み後にフラッシュする手段がないため、行単位で書き出す
+        logger.add(
+            log_file_path,
+            level=log_level,
+            format=file_log_format,
+            encoding="utf-8",
+            buffering=1,
+            enqueue=True,
+            backtrace=False,
+            diagnose=False,
+            rotation=log_rotation,
+            retention=log_retention,
+            compression=log_compression,
+        )
+
+    # 変数値の repr を伴う詳細なトレースバックは、件数の少ない高レベルのレコードだけに限定して別ファイルへ出力する
     logger.add(
-        log_file_path,
-        level=log_level,
+        os.path.join(log_dir, "diagnose.log"),
+        level=diagnose_level,
         format=file_log_format,
         encoding="utf-8",
         enqueue=True,
@@ -72,9 +293,11 @@ def configure_logging(
     )
 
 
+@functools.lru_cache(maxsize=256)
 def get_logger(name):
     """
     loguru ロガーを取得する関数。
+    同じ名前に対しては同じロガーオブジェクトを返す (bind() による生成は名前ごとに 1 回のみ)。
 
     Args:
         name (str): ロガー名
@@ -85,13 +308,51 @@ def get_logger(name):
     return logger.bind(name=name)
 
 
-# pandas の表示設定を変更
-pd.set_option("display.max_rows", 20)  # 最大表示行数
-pd.set_option("display.max_columns", 20)  # 最大表示列数
-pd.set_option("display.width", 100)  # コンソールの表示幅
-pd.set_option("display.colheader_justify", "center")  # カラムヘッダの配置
-pd.set_option("display.precision", 3)  # 小数点以下の桁数
-pd.set_option('display.unicode.east_asian_width', True)  # 文字幅の調整
+# DataFrame をログに出力する間だけ適用する pandas の表示設定 (グローバルな設定は変更しない)
+_DATAFRAME_DISPLAY_OPTIONS = (
+    "display.max_rows", 20,  # 最大表示行数
+    "display.max_columns", 20,  # 最大表示列数
+    "display.width", 100,  # コンソールの表示幅
+    "display.colheader_justify", "center",  # カラムヘッダの配置
+    "display.precision", 3,  # 小数点以下の桁数
+    "display.unicode.east_asian_width", True,  # 文字幅の調整
+)
+
+
+# 配列の各要素に str() を適用する ufunc (戻り値は object 配列)
+_TO_STR = np.frompyfunc(str, 1, 1)
+
+
+def _format_dataframe(df, max_col_width):
+    """
+    DataFrame を tabulate でグリッド形式の表文字列に整形する。
+
+    Args:
+        df: 整形する pandas DataFrame
+        max_col_width (int): 各カラムの最大幅。これを超えるテキストは切り捨てられます。
+
+    Returns:
+        str: 整形された表の文字列。
+    """
+    # tabulate は DataFrame を出力する場合にのみ必要なため、ここでインポートする
+    from tabulate import tabulate
+
+    headers = [f"{col}\n({dtype})" for col, dtype in zip(df.columns, df.dtypes)]
+
+    with pd.option_context(*_DATAFRAME_DISPLAY_OPTIONS):
+        # 行ごとではなく配列全体を一度に文字列へ変換し、最大幅を超える文字列だけを列ごとに切り捨てる
+        values = df.to_numpy(dtype=object)
+        str_values = _TO_STR(values)
+        for i, dtype in enumerate(df.dtypes):
+            if pd.api.types.is_numeric_dtype(dtype) or pd.api.types.is_datetime64_any_dtype(dtype):
+                continue  # 文字列を含まない列は切り捨ての対象外
+            column = pd.Series(str_values[:, i])
+            mask = pd.Series(values[:, i]).map(lambda value: isinstance(value, str)) & (column.str.len() > max_col_width)
+            if mask.any():
+                str_values[mask.to_numpy(), i] = (column[mask].str.slice(0, max_col_width) + "...").to_numpy()
+        formatted_rows = str_values.tolist()
+
+        return tabulate(formatted_rows, headers=headers, tablefmt="grid")  # tablefmt を "grid" に設定
 
 
 def log_dataframe(logger_instance, df, level="info", max_col_width=20):
@@ -106,44 +367,19 @@ def log_dataframe(logger_instance, df, level="info", max_col_width=20):
         level: ログレベル ("debug", "info", "warning", "error", "critical")
         max_col_width (int, optional): 各カラムの最大幅。これを超えるテキストは切り捨てられます。Defaults to 20.
     """
-    headers = []
-    for col in df.columns:
-        dtype_str = str(df[col].dtype)
-        headers.append(f"{col}\n({dtype_str})")
-
-    formatted_rows = []
-    for index, row in df.iterrows():
-        formatted_row = []
-        for x in row:
-            if isinstance(x, str) and len(x) > max_col_width:
-                formatted_row.append(x[:max_col_width] + "...")
-            else:
-                formatted_row.append(str(x))
-        formatted_rows.append(formatted_row)
-
-    table = tabulate(formatted_rows, headers=headers, tablefmt="grid")  # tablefmt を "grid" に設定
-
-    # ログレベルに応じてコンソールに出力
-    if level == "debug":
-        logger_instance.debug(f"\n{table}")
-    elif level == "info":
-        logger_instance.info(f"\n{table}")
-    elif level == "warning":
-        logger_instance.warning(f"\n{table}")
-    elif level == "error":
-        logger_instance.error(f"\n{table}")
-    elif level == "critical":
-        logger_instance.critical(f"\n{table}")
-    else:
-        logger_instance.info(f"\n{table}")
+    # 未知のログレベルは info として扱う
+    level_name = level.upper() if level in ("debug", "info", "warning", "error", "critical") else "INFO"
 
+    # 表の整形は遅延評価し、ログレベルで出力されない場合は tabulate を実行しない
+    logger_instance.opt(lazy=True).log(level_name, "\n{}", lambda: _format_dataframe(df, max_col_width))
 
 
 def log_dataframe_pprint(logger_instance, df, level="info"):
     """
     pprint を使って DataFrame をコンソールに出力する関数。
     """
-    logger_instance.info(f"DataFrame:\n{df.to_string()}")
+    with pd.option_context(*_DATAFRAME_DISPLAY_OPTIONS):
+        logger_instance.info(f"DataFrame:\n{df.to_string()}")
 
 
 if __name__ == "__main__":
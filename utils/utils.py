@@ -0,0 +1,66 @@
+import json
+import sys
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # orjson がインストールされていない場合は標準ライブラリの json を使用する
+    orjson = None
+
+
+def dump_json_bytes(data: Any) -> bytes:
+    """
+    データを UTF-8 の JSON バイト列に変換する。
+    orjson が利用可能な場合は orjson を使用し、そうでない場合は標準ライブラリの json を使用する。
+
+    Args:
+        data (Any): 変換するデータ。
+
+    Returns:
+        bytes: インデント付きの JSON バイト列。
+    """
+    if orjson is not None:
+        return orjson.dumps(
+            data,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY,
+        )
+    return json.dumps(data, ensure_ascii=False, indent=2).encode("utf-8")
+
+
+def load_json_bytes(data: bytes) -> Any:
+    """
+    UTF-8 の JSON バイト列をデータに変換する。
+    orjson が利用可能な場合は orjson を使用し、そうでない場合は標準ライブラリの json を使用する。
+
+    Args:
+        data (bytes): 変換する JSON バイト列。
+
+    Returns:
+        Any: 変換後のデータ。
+
+    Raises:
+        ValueError: JSON として解析できない場合。
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def print_json(data: Any) -> None:
+    """
+    データを JSON として標準出力に書き出す。
+    dump_json_bytes のバイト列を str に変換せず、標準出力のバッファへそのまま書き込む。
+    標準出力がバッファを持たない場合 (io.StringIO への置き換えなど) は str に変換して書き込む。
+
+    Args:
+        data (Any): 出力するデータ。
+    """
+    output = dump_json_bytes(data) + b"\n"
+    buffer = getattr(sys.stdout, "buffer", None)
+    if buffer is None:
+        sys.stdout.write(output.decode("utf-8"))
+        return
+    # print() で書き込んだ内容との順序を保つため、先にテキスト層をフラッシュする
+    sys.stdout.flush()
+    buffer.write(output)
+    buffer.flush()